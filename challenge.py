@@ -10,11 +10,15 @@ Handles:
 - Challenge-defense resolution
 """
 
+import heapq
 import time
-from typing import Optional, Dict, List, Tuple
+from collections import deque
+from typing import Optional, Dict, List, Sequence, Set, Tuple, Union
 from dataclasses import dataclass, field
-from enum import Enum
-from datetime import datetime, timedelta
+from enum import IntEnum
+from datetime import datetime, timezone
+
+import numpy as np
 
 from .protocol import (
     AttackType, 
@@ -23,7 +27,9 @@ from .protocol import (
     ChallengeSubmission,
     DefenseSubmission,
     ReasoningTree,
-    ATTACK_MULTIPLIERS
+    ATTACK_MULTIPLIERS,
+    ATTACK_MULTIPLIER_ARRAY,
+    ATTACK_TYPE_CODES,
 )
 
 
@@ -35,23 +41,44 @@ CHALLENGE_WINDOW_HOURS = 6      # Time to challenge a tree after submission
 DEFENSE_WINDOW_HOURS = 2        # Time to defend after challenge
 MIN_CHALLENGE_STAKE_RATIO = 0.1 # Min challenge stake = 10% of proposer stake
 
+CHALLENGE_WINDOW_SECONDS = CHALLENGE_WINDOW_HOURS * 3600
+DEFENSE_WINDOW_SECONDS = DEFENSE_WINDOW_HOURS * 3600
+
+MAX_RESOLVED_DISPUTES = 10_000  # Resolved disputes kept for lookup, oldest pruned first
+
 # Slash rates
 PROPOSER_SLASH_RATE = 0.30      # 30% of proposer stake on successful challenge
 CHALLENGER_SLASH_RATE = 0.50    # 50% of challenger stake on failed challenge
 
+# Payout coefficients per attack type, folded once at import so resolvers
+# only multiply by stake and confidence.
+# Challenger wins: (attack multiplier, proposer slash rate)
+_CHALLENGER_WIN_COEFFS = {
+    at: (m, PROPOSER_SLASH_RATE) for at, m in ATTACK_MULTIPLIERS.items()
+}
+# Partial: (reward rate, proposer slash rate, challenger fee rate) - both sides take reduced hits
+_PARTIAL_COEFFS = {
+    at: (m * 0.5, PROPOSER_SLASH_RATE * 0.5, 0.2) for at, m in ATTACK_MULTIPLIERS.items()
+}
+# No defense: (attack multiplier, proposer slash rate) - 45% on no-show, capped at full stake
+_NO_DEFENSE_COEFFS = {
+    at: (m, min(PROPOSER_SLASH_RATE * 1.5, 1.0)) for at, m in ATTACK_MULTIPLIERS.items()
+}
+
 
-class DisputeStatus(str, Enum):
-    """Status of a dispute."""
-    PENDING_DEFENSE = "pending_defense"
-    PENDING_ADJUDICATION = "pending_adjudication"
-    RESOLVED = "resolved"
-    EXPIRED = "expired"
+class DisputeStatus(IntEnum):
+    """Status of a dispute (internal only; use .name at API boundaries)."""
+    PENDING_DEFENSE = 0
+    PENDING_ADJUDICATION = 1
+    RESOLVED = 2
+    EXPIRED = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class Dispute:
     """Active dispute between proposer and challenger."""
     dispute_id: str
+    key: int  # Internal integer key used by ChallengeManager indexes
     task_id: str
     target_node_id: str
     
@@ -70,21 +97,51 @@ class Dispute:
     
     # Defense details
     defense: Optional[DefenseSubmission] = None
-    defense_deadline: Optional[datetime] = None
+    defense_deadline: Optional[float] = None  # Unix timestamp
     
     # Resolution
     status: DisputeStatus = DisputeStatus.PENDING_DEFENSE
     verdict: Optional[Verdict] = None
     
-    # Timestamps
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    resolved_at: Optional[datetime] = None
+    # Timestamps (Unix seconds)
+    created_at: float = field(default_factory=time.time)
+    resolved_at: Optional[float] = None
     
     # Calculated outcomes
     proposer_payout: float = 0.0
     challenger_payout: float = 0.0
     proposer_reputation_delta: float = 0.0
     challenger_reputation_delta: float = 0.0
+    
+    @property
+    def resolved_at_dt(self) -> Optional[datetime]:
+        """Resolution time as a UTC datetime, built only when asked for."""
+        if self.resolved_at is None:
+            return None
+        return datetime.fromtimestamp(self.resolved_at, tz=timezone.utc)
+
+
+def _get_challenge_window_end(tree: ReasoningTree) -> Optional[float]:
+    """
+    Get the end of a tree's challenge window as a Unix timestamp.
+    
+    submitted_at is an ISO string (naive values are UTC). The parsed value
+    is cached on the tree and only recomputed if submitted_at changes.
+    """
+    submitted_at = tree.submitted_at
+    if not submitted_at:
+        return None
+    
+    cached = tree._challenge_window
+    if cached is None or cached[0] != submitted_at:
+        submitted = datetime.fromisoformat(submitted_at)
+        if submitted.tzinfo is None:
+            submitted = submitted.replace(tzinfo=timezone.utc)
+        window_end = submitted.timestamp() + CHALLENGE_WINDOW_SECONDS
+        cached = (submitted_at, window_end)
+        tree._challenge_window = cached
+    
+    return cached[1]
 
 
 class ChallengeManager:
@@ -98,9 +155,18 @@ class ChallengeManager:
     - Coordinate with validators for adjudication
     """
     
-    def __init__(self):
-        self.disputes: Dict[str, Dispute] = {}
-        self.tree_challenges: Dict[str, List[str]] = {}  # task_id -> dispute_ids
+    def __init__(self, max_resolved_disputes: int = MAX_RESOLVED_DISPUTES):
+        # Disputes are keyed internally by their integer counter value; the
+        # string dispute_id is only used at the API boundary.
+        self.disputes: Dict[int, Dispute] = {}
+        self.dispute_id_to_int: Dict[str, int] = {}
+        self.tree_challenges: Dict[str, List[int]] = {}  # task_id -> dispute keys
+        self.challenged_nodes_by_task: Dict[str, Set[str]] = {}  # task_id -> actively challenged node_ids
+        self._pending_defense_heap: List[Tuple[float, int]] = []  # (defense_deadline, dispute key)
+        self.pending_adjudication_ids: Set[int] = set()
+        self.active_disputes_by_task: Dict[str, Set[int]] = {}  # task_id -> unresolved dispute keys
+        self._resolved_keys: deque = deque()  # resolved dispute keys, oldest first
+        self.max_resolved_disputes = max_resolved_disputes
         self.dispute_counter = 0
     
     def validate_challenge(
@@ -120,30 +186,26 @@ class ChallengeManager:
         Returns:
             (is_valid, error_message)
         """
+        target_node = challenge.target_node
+        challenge_stake = challenge.stake
+        
         # Check target node exists
-        node_ids = [tree.root.id] + [n.id for n in tree.nodes]
-        if challenge.target_node not in node_ids:
-            return False, f"Target node {challenge.target_node} not found in tree"
+        if target_node not in tree.node_index:
+            return False, f"Target node {target_node} not found in tree"
         
         # Check minimum stake
         min_stake = tree.stake * MIN_CHALLENGE_STAKE_RATIO
-        if challenge.stake < min_stake:
-            return False, f"Challenge stake {challenge.stake} below minimum {min_stake}"
+        if challenge_stake < min_stake:
+            return False, f"Challenge stake {challenge_stake} below minimum {min_stake}"
         
         # Check challenge window
-        if tree.submitted_at:
-            submitted = datetime.fromisoformat(tree.submitted_at)
-            window_end = submitted + timedelta(hours=CHALLENGE_WINDOW_HOURS)
-            if datetime.utcnow() > window_end:
-                return False, "Challenge window has closed"
+        window_end = _get_challenge_window_end(tree)
+        if window_end and time.time() > window_end:
+            return False, "Challenge window has closed"
         
         # Check for duplicate challenges on same node
-        task_disputes = self.tree_challenges.get(tree.task_id, [])
-        for dispute_id in task_disputes:
-            dispute = self.disputes.get(dispute_id)
-            if dispute and dispute.target_node_id == challenge.target_node:
-                if dispute.status != DisputeStatus.RESOLVED:
-                    return False, f"Node {challenge.target_node} already has active challenge"
+        if target_node in self.challenged_nodes_by_task.get(tree.task_id, ()):
+            return False, f"Node {target_node} already has active challenge"
         
         return True, None
     
@@ -154,10 +216,12 @@ class ChallengeManager:
     ) -> Dispute:
         """Create a new dispute from a validated challenge."""
         self.dispute_counter += 1
-        dispute_id = f"disp_{tree.task_id}_{self.dispute_counter}"
+        key = self.dispute_counter
+        dispute_id = f"disp_{tree.task_id}_{key}"
         
         dispute = Dispute(
             dispute_id=dispute_id,
+            key=key,
             task_id=tree.task_id,
             target_node_id=challenge.target_node,
             proposer_hotkey=tree.proposer_hotkey,
@@ -166,16 +230,18 @@ class ChallengeManager:
             challenger_stake=challenge.stake,
             attack_type=challenge.attack_type,
             challenge_argument=challenge.argument,
-            challenge_evidence=challenge.evidence.dict() if challenge.evidence else None,
-            defense_deadline=datetime.utcnow() + timedelta(hours=DEFENSE_WINDOW_HOURS),
+            challenge_evidence=challenge.evidence.as_dict if challenge.evidence else None,
+            defense_deadline=time.time() + DEFENSE_WINDOW_SECONDS,
             status=DisputeStatus.PENDING_DEFENSE
         )
         
-        self.disputes[dispute_id] = dispute
+        self.disputes[key] = dispute
+        self.dispute_id_to_int[dispute_id] = key
+        self.challenged_nodes_by_task.setdefault(tree.task_id, set()).add(challenge.target_node)
+        heapq.heappush(self._pending_defense_heap, (dispute.defense_deadline, key))
+        self.active_disputes_by_task.setdefault(tree.task_id, set()).add(key)
         
-        if tree.task_id not in self.tree_challenges:
-            self.tree_challenges[tree.task_id] = []
-        self.tree_challenges[tree.task_id].append(dispute_id)
+        self.tree_challenges.setdefault(tree.task_id, []).append(key)
         
         return dispute
     
@@ -190,18 +256,19 @@ class ChallengeManager:
         Returns:
             (success, error_message)
         """
-        dispute = self.disputes.get(dispute_id)
+        dispute = self.get_dispute(dispute_id)
         if not dispute:
             return False, f"Dispute {dispute_id} not found"
         
         if dispute.status != DisputeStatus.PENDING_DEFENSE:
-            return False, f"Dispute not accepting defenses (status: {dispute.status})"
+            return False, f"Dispute not accepting defenses (status: {dispute.status.name.lower()})"
         
-        if datetime.utcnow() > dispute.defense_deadline:
+        if time.time() > dispute.defense_deadline:
             return False, "Defense window has expired"
         
         dispute.defense = defense
         dispute.status = DisputeStatus.PENDING_ADJUDICATION
+        self.pending_adjudication_ids.add(dispute.key)
         
         return True, None
     
@@ -210,34 +277,80 @@ class ChallengeManager:
         Check for disputes where defense window expired.
         
         Returns list of dispute IDs that auto-resolved (no defense).
+        
+        Only heap entries whose deadline has passed are visited. Entries for
+        disputes that were defended or resolved in the meantime are stale
+        and simply dropped.
         """
         expired = []
-        now = datetime.utcnow()
-        
-        for dispute_id, dispute in self.disputes.items():
-            if dispute.status == DisputeStatus.PENDING_DEFENSE:
-                if dispute.defense_deadline and now > dispute.defense_deadline:
-                    # No defense submitted - auto-resolve for challenger
-                    self._resolve_no_defense(dispute)
-                    expired.append(dispute_id)
+        now = time.time()
+        heap = self._pending_defense_heap
+        
+        while heap and heap[0][0] < now:
+            deadline, key = heapq.heappop(heap)
+            dispute = self.disputes.get(key)
+            if (dispute and dispute.status == DisputeStatus.PENDING_DEFENSE
+                    and dispute.defense_deadline == deadline):
+                # No defense submitted - auto-resolve for challenger
+                self._resolve_no_defense(dispute, now)
+                expired.append(dispute.dispute_id)
         
         return expired
     
-    def _resolve_no_defense(self, dispute: Dispute):
-        """Resolve a dispute where proposer didn't defend."""
+    def _release_indexes(self, dispute: Dispute):
+        """
+        Drop a resolved dispute from the per-task active indexes and queue it
+        for pruning once max_resolved_disputes is exceeded.
+        
+        pending_adjudication_ids is maintained by the callers: no-defense
+        disputes were never in it, and resolve_disputes clears it per batch.
+        """
+        task_active = self.active_disputes_by_task.get(dispute.task_id)
+        if task_active is None or dispute.key not in task_active:
+            # Already released; a newer dispute may hold the node's guard now
+            return
+        task_active.discard(dispute.key)
+        challenged = self.challenged_nodes_by_task.get(dispute.task_id)
+        if challenged is not None:
+            challenged.discard(dispute.target_node_id)
+        
+        self._resolved_keys.append(dispute.key)
+        self._prune_resolved()
+    
+    def _prune_resolved(self):
+        """Forget the oldest resolved disputes beyond max_resolved_disputes."""
+        resolved = self._resolved_keys
+        while len(resolved) > self.max_resolved_disputes:
+            dispute = self.disputes.pop(resolved.popleft(), None)
+            if dispute is None:
+                continue
+            self.dispute_id_to_int.pop(dispute.dispute_id, None)
+            task_keys = self.tree_challenges.get(dispute.task_id)
+            if task_keys is not None:
+                task_keys.remove(dispute.key)
+                if not task_keys:
+                    del self.tree_challenges[dispute.task_id]
+                    self.challenged_nodes_by_task.pop(dispute.task_id, None)
+                    self.active_disputes_by_task.pop(dispute.task_id, None)
+    
+    def _resolve_no_defense(self, dispute: Dispute, now: Optional[float] = None):
+        """
+        Resolve a dispute where proposer didn't defend.
+        
+        Sweeps pass their own `now` so a whole batch shares one timestamp.
+        """
         dispute.status = DisputeStatus.RESOLVED
         dispute.verdict = Verdict.CHALLENGE_UPHELD
-        dispute.resolved_at = datetime.utcnow()
+        dispute.resolved_at = time.time() if now is None else now
+        self._release_indexes(dispute)
+        
+        multiplier, slash_rate = _NO_DEFENSE_COEFFS[dispute.attack_type]
         
         # Challenger gets full reward + bonus for no-show
-        multiplier = ATTACK_MULTIPLIERS[dispute.attack_type]
         base_reward = dispute.challenger_stake * multiplier
         
         # Proposer max slash on no-defense
-        proposer_slash = min(
-            dispute.proposer_stake * (PROPOSER_SLASH_RATE * 1.5),  # 45% on no-show
-            dispute.proposer_stake
-        )
+        proposer_slash = dispute.proposer_stake * slash_rate
         
         dispute.challenger_payout = base_reward + proposer_slash
         dispute.proposer_payout = -proposer_slash
@@ -261,37 +374,67 @@ class ChallengeManager:
         Returns:
             Resolution summary with stake/reputation changes
         """
-        dispute = self.disputes.get(dispute_id)
-        if not dispute:
-            return {"error": f"Dispute {dispute_id} not found"}
+        return self.resolve_disputes([(dispute_id, verdict, confidence)])[0]
+    
+    def resolve_disputes(
+        self,
+        entries: List[Tuple[str, Verdict, float]]
+    ) -> List[Dict]:
+        """
+        Resolve a batch of disputes, e.g. all verdicts from one consensus round.
         
-        dispute.status = DisputeStatus.RESOLVED
-        dispute.verdict = verdict
-        dispute.resolved_at = datetime.utcnow()
-        
-        if verdict == Verdict.CHALLENGE_UPHELD:
-            self._resolve_challenger_wins(dispute, confidence)
-        elif verdict == Verdict.CHALLENGE_REJECTED:
-            self._resolve_proposer_wins(dispute, confidence)
-        elif verdict == Verdict.PARTIAL:
-            self._resolve_partial(dispute, confidence)
-        
-        return {
-            "dispute_id": dispute_id,
-            "verdict": verdict.value,
-            "proposer_payout": dispute.proposer_payout,
-            "challenger_payout": dispute.challenger_payout,
-            "proposer_reputation_delta": dispute.proposer_reputation_delta,
-            "challenger_reputation_delta": dispute.challenger_reputation_delta
-        }
+        The batch shares one resolution timestamp and the pending-adjudication
+        index is updated once at the end.
+        
+        Args:
+            entries: (dispute_id, verdict, confidence) tuples
+            
+        Returns:
+            One resolution summary per entry, in the same order
+        """
+        now = time.time()
+        results = []
+        resolved_keys = []
+        
+        for dispute_id, verdict, confidence in entries:
+            dispute = self.get_dispute(dispute_id)
+            if not dispute:
+                results.append({"error": f"Dispute {dispute_id} not found"})
+                continue
+            
+            dispute.status = DisputeStatus.RESOLVED
+            dispute.verdict = verdict
+            dispute.resolved_at = now
+            self._release_indexes(dispute)
+            resolved_keys.append(dispute.key)
+            
+            if verdict == Verdict.CHALLENGE_UPHELD:
+                self._resolve_challenger_wins(dispute, confidence)
+            elif verdict == Verdict.CHALLENGE_REJECTED:
+                self._resolve_proposer_wins(dispute, confidence)
+            elif verdict == Verdict.PARTIAL:
+                self._resolve_partial(dispute, confidence)
+            
+            results.append({
+                "dispute_id": dispute_id,
+                "verdict": verdict.value,
+                "proposer_payout": dispute.proposer_payout,
+                "challenger_payout": dispute.challenger_payout,
+                "proposer_reputation_delta": dispute.proposer_reputation_delta,
+                "challenger_reputation_delta": dispute.challenger_reputation_delta
+            })
+        
+        self.pending_adjudication_ids.difference_update(resolved_keys)
+        
+        return results
     
     def _resolve_challenger_wins(self, dispute: Dispute, confidence: float):
         """Calculate payouts when challenger wins."""
-        multiplier = ATTACK_MULTIPLIERS[dispute.attack_type]
+        multiplier, slash_rate = _CHALLENGER_WIN_COEFFS[dispute.attack_type]
         
         # Challenger reward
         base_reward = dispute.challenger_stake * multiplier * confidence
-        proposer_slash = dispute.proposer_stake * PROPOSER_SLASH_RATE * confidence
+        proposer_slash = dispute.proposer_stake * slash_rate * confidence
         
         dispute.challenger_payout = base_reward + proposer_slash
         dispute.proposer_payout = -proposer_slash
@@ -313,41 +456,44 @@ class ChallengeManager:
     def _resolve_partial(self, dispute: Dispute, confidence: float):
         """Calculate payouts for partial verdict."""
         # Both sides take reduced hits
-        partial_factor = 0.5
+        reward_rate, slash_rate, fee_rate = _PARTIAL_COEFFS[dispute.attack_type]
+        challenger_stake = dispute.challenger_stake
         
-        multiplier = ATTACK_MULTIPLIERS[dispute.attack_type]
-        challenger_reward = dispute.challenger_stake * multiplier * partial_factor * confidence
-        proposer_slash = dispute.proposer_stake * PROPOSER_SLASH_RATE * partial_factor * confidence
+        challenger_reward = challenger_stake * reward_rate * confidence
+        proposer_slash = dispute.proposer_stake * slash_rate * confidence
         
-        dispute.challenger_payout = challenger_reward + proposer_slash - (dispute.challenger_stake * 0.2)
+        dispute.challenger_payout = challenger_reward + proposer_slash - (challenger_stake * fee_rate)
         dispute.proposer_payout = -proposer_slash
         dispute.proposer_reputation_delta = -0.03 * confidence
         dispute.challenger_reputation_delta = 0.01 * confidence
     
     def get_dispute(self, dispute_id: str) -> Optional[Dispute]:
         """Get a dispute by ID."""
-        return self.disputes.get(dispute_id)
+        key = self.dispute_id_to_int.get(dispute_id)
+        if key is None:
+            return None
+        return self.disputes.get(key)
     
     def get_pending_adjudication(self) -> List[Dispute]:
-        """Get all disputes pending adjudication."""
-        return [
-            d for d in self.disputes.values() 
-            if d.status == DisputeStatus.PENDING_ADJUDICATION
-        ]
+        """Get all disputes pending adjudication, in creation order."""
+        # Keys follow dispute_counter, so sorting restores creation order
+        return [self.disputes[key] for key in sorted(self.pending_adjudication_ids)]
     
     def get_active_disputes_for_tree(self, task_id: str) -> List[Dispute]:
         """Get all active disputes for a reasoning tree."""
-        dispute_ids = self.tree_challenges.get(task_id, [])
-        return [
-            self.disputes[did] for did in dispute_ids 
-            if did in self.disputes and self.disputes[did].status != DisputeStatus.RESOLVED
-        ]
+        keys = self.active_disputes_by_task.get(task_id, ())
+        return [self.disputes[key] for key in keys]
 
 
 # ============================================================================
 # Challenge Detection Utilities
 # ============================================================================
 
+# Per-attack-type (reward multiplier, slash rate if rejected) for quality analysis
+_ATTACK_ANALYSIS = {
+    at: (m, CHALLENGER_SLASH_RATE) for at, m in ATTACK_MULTIPLIERS.items()
+}
+
 def analyze_challenge_quality(
     challenge: ChallengeSubmission,
     tree: ReasoningTree
@@ -358,25 +504,21 @@ def analyze_challenge_quality(
     Returns scoring signals that challengers can use to evaluate EV.
     """
     # Find the target node
-    target_node = None
-    if tree.root.id == challenge.target_node:
-        target_node = tree.root
-    else:
-        for node in tree.nodes:
-            if node.id == challenge.target_node:
-                target_node = node
-                break
+    target_node = tree.node_index.get(challenge.target_node)
     
     if not target_node:
         return {"error": "Target node not found"}
     
+    multiplier, slash_rate = _ATTACK_ANALYSIS[challenge.attack_type]
+    stake = challenge.stake
+    
     analysis = {
         "target_node_type": target_node.node_type.value,
         "has_evidence": target_node.evidence is not None,
         "num_children": len(target_node.children),
-        "attack_multiplier": ATTACK_MULTIPLIERS[challenge.attack_type],
-        "estimated_reward": challenge.stake * ATTACK_MULTIPLIERS[challenge.attack_type],
-        "max_slash_if_rejected": challenge.stake * CHALLENGER_SLASH_RATE,
+        "attack_multiplier": multiplier,
+        "estimated_reward": stake * multiplier,
+        "max_slash_if_rejected": stake * slash_rate,
     }
     
     # Risk assessment
@@ -415,6 +557,47 @@ def calculate_challenge_ev(
     ev = (win_probability * reward) - ((1 - win_probability) * penalty)
     
     return ev
+
+
+def calculate_challenge_ev_batch(
+    challenge_stakes: np.ndarray,
+    attack_types: Union[Sequence[AttackType], np.ndarray],
+    proposer_stakes: np.ndarray,
+    win_probabilities: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate expected values for many candidate challenges at once.
+    
+    Same formula as calculate_challenge_ev, evaluated as array arithmetic.
+    Numeric arguments broadcast against each other, so a scalar proposer
+    stake can be used with arrays of candidate stakes and probabilities.
+    
+    Args:
+        challenge_stakes: TAO to stake on each challenge
+        attack_types: AttackType per candidate, or an integer array of
+            codes in AttackType declaration order
+        proposer_stakes: Proposer's stake on each tree
+        win_probabilities: Estimated probability of winning (0-1)
+        
+    Returns:
+        Array of expected values in TAO
+    """
+    if isinstance(attack_types, np.ndarray) and attack_types.dtype.kind in "iu":
+        codes = attack_types
+    else:
+        codes = np.fromiter((ATTACK_TYPE_CODES[at] for at in attack_types), dtype=np.intp)
+    
+    challenge_stakes = np.asarray(challenge_stakes, dtype=np.float64)
+    win_probabilities = np.asarray(win_probabilities, dtype=np.float64)
+    multipliers = ATTACK_MULTIPLIER_ARRAY[codes]
+    
+    # Win outcome
+    reward = challenge_stakes * multipliers + np.asarray(proposer_stakes, dtype=np.float64) * PROPOSER_SLASH_RATE
+    
+    # Lose outcome
+    penalty = challenge_stakes * CHALLENGER_SLASH_RATE
+    
+    return win_probabilities * reward - (1 - win_probabilities) * penalty
 ```
 
 ---
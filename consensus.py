@@ -7,13 +7,16 @@ Implements weighted voting, calibration scoring, and tier-based adjudication
 for dispute resolution.
 """
 
-import random
-from typing import Dict, List, Optional, Tuple
+import heapq
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from enum import Enum
 import math
 
+import numpy as np
+
 from .protocol import Verdict, DisputeForAdjudication
 
 
@@ -23,9 +26,12 @@ from .protocol import Verdict, DisputeForAdjudication
 
 ADJUDICATION_WINDOW_HOURS = 4
 ESCALATION_WINDOW_HOURS = 6
+ARBITER_RETRY_SECONDS = 60.0  # Recheck for arbiters this often while none are available
 CONSENSUS_THRESHOLD = 0.6
 CALIBRATION_DECAY_PER_EPOCH = 0.02
 CALIBRATION_TIME_CONSTANT_DAYS = 30
+SECONDS_PER_HOUR = 3600.0
+SECONDS_PER_DAY = 86400.0
 
 
 class ValidatorTier(str, Enum):
@@ -57,6 +63,23 @@ TIER_CONFIG = {
 }
 
 
+# Verdict <-> dense index for the per-dispute weight accumulators
+_VERDICTS = list(Verdict)
+_VERDICT_INDEX = {verdict: i for i, verdict in enumerate(_VERDICTS)}
+
+# ValidatorState fields that feed effective_weight
+_WEIGHT_INPUTS = frozenset({"stake", "calibration_score", "tier"})
+# Numeric ValidatorState fields -> the _ValidatorColumns array mirroring them
+_FIELD_COLUMNS = {
+    "stake": "stake",
+    "calibration_score": "calibration",
+    "cases_this_epoch": "cases",
+    "last_active": "last_active",
+}
+# ValidatorState fields mirrored into ValidatorConsensus's column arrays
+_COLUMN_FIELDS = _WEIGHT_INPUTS.union(_FIELD_COLUMNS)
+
+
 @dataclass
 class ValidatorState:
     """Tracks a validator's state and history."""
@@ -67,18 +90,40 @@ class ValidatorState:
     verdicts_submitted: int = 0
     correct_verdicts: int = 0
     cases_this_epoch: int = 0
-    last_active: datetime = field(default_factory=datetime.utcnow)
-    tier_start_date: datetime = field(default_factory=datetime.utcnow)
-    slashing_events: List[datetime] = field(default_factory=list)
+    # Timestamps are epoch seconds
+    last_active: float = field(default_factory=time.time)
+    tier_start_date: float = field(default_factory=time.time)
+    slashing_events: List[float] = field(default_factory=list)
+    
+    # Time-decayed running sums for calibration; their ratio is the
+    # exponentially weighted mean of verdict scores
+    calibration_weighted_sum: float = 0.0
+    calibration_weight_total: float = 0.0
+    last_verdict_ts: Optional[float] = None  # epoch seconds
+    
+    def __post_init__(self):
+        self._refresh_effective_weight()
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name not in _COLUMN_FIELDS:
+            return
+        # Keep the cached weight in step with its inputs once initialized
+        if name in _WEIGHT_INPUTS and "_effective_weight" in self.__dict__:
+            self._refresh_effective_weight()
+        # Write the changed field through to the consensus columns, if attached
+        columns = self.__dict__.get("_columns")
+        if columns is not None:
+            columns.store_field(self._row, self, name)
     
-    # Verdict history for calibration
-    verdict_history: List[Dict] = field(default_factory=list)
+    def _refresh_effective_weight(self):
+        tier_mult = TIER_CONFIG[self.tier]["weight_multiplier"]
+        object.__setattr__(self, "_effective_weight", self.stake * self.calibration_score * tier_mult)
     
     @property
     def effective_weight(self) -> float:
-        """Calculate effective voting weight."""
-        tier_mult = TIER_CONFIG[self.tier]["weight_multiplier"]
-        return self.stake * self.calibration_score * tier_mult
+        """Effective voting weight, cached on stake/calibration/tier change."""
+        return self._effective_weight
     
     @property
     def can_take_case(self) -> bool:
@@ -87,6 +132,84 @@ class ValidatorState:
         return self.cases_this_epoch < max_cases
 
 
+class _ValidatorColumns:
+    """
+    Parallel arrays mirroring the numeric ValidatorState fields.
+    
+    Rows are assigned per hotkey on registration and kept current by
+    ValidatorState.__setattr__, so eligibility and weighting run as
+    vectorized passes instead of attribute walks. Hotkeys are also
+    indexed by tier.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self.row_of: Dict[str, int] = {}
+        self.hotkeys: List[str] = []
+        self.tiers: List[ValidatorTier] = []
+        self.by_tier: Dict[ValidatorTier, Set[str]] = {tier: set() for tier in ValidatorTier}
+        self.stake = np.zeros(capacity, dtype=np.float64)
+        self.calibration = np.zeros(capacity, dtype=np.float64)
+        self.tier_mult = np.zeros(capacity, dtype=np.float64)
+        self.max_cases = np.zeros(capacity, dtype=np.float64)
+        self.cases = np.zeros(capacity, dtype=np.float64)
+        self.last_active = np.zeros(capacity, dtype=np.float64)  # epoch seconds
+    
+    def attach(self, validator: ValidatorState):
+        """Assign (or reuse) the validator's row and start mirroring it."""
+        row = self.row_of.get(validator.hotkey)
+        if row is None:
+            row = len(self.hotkeys)
+            if row == self.stake.size:
+                self._grow(2 * row)
+            self.row_of[validator.hotkey] = row
+            self.hotkeys.append(validator.hotkey)
+            self.tiers.append(validator.tier)
+            self.by_tier[validator.tier].add(validator.hotkey)
+        object.__setattr__(validator, "_columns", self)
+        object.__setattr__(validator, "_row", row)
+        self.store(row, validator)
+    
+    def detach(self, validator: ValidatorState):
+        """Stop mirroring a validator that has been replaced."""
+        object.__setattr__(validator, "_columns", None)
+    
+    def store(self, row: int, validator: ValidatorState):
+        """Mirror every column of a validator's row."""
+        self._store_tier(row, validator)
+        for name, column in _FIELD_COLUMNS.items():
+            getattr(self, column)[row] = getattr(validator, name)
+    
+    def store_field(self, row: int, validator: ValidatorState, name: str):
+        """Mirror a single changed field of a validator's row."""
+        if name == "tier":
+            self._store_tier(row, validator)
+        else:
+            getattr(self, _FIELD_COLUMNS[name])[row] = getattr(validator, name)
+    
+    def _store_tier(self, row: int, validator: ValidatorState):
+        tier = validator.tier
+        if self.tiers[row] != tier:
+            self.by_tier[self.tiers[row]].discard(validator.hotkey)
+            self.by_tier[tier].add(validator.hotkey)
+            self.tiers[row] = tier
+        
+        config = TIER_CONFIG[tier]
+        self.tier_mult[row] = config["weight_multiplier"]
+        self.max_cases[row] = config["max_cases_per_epoch"]
+    
+    def effective_weights(self) -> np.ndarray:
+        """Vectorized ValidatorState.effective_weight for every row."""
+        n = len(self.hotkeys)
+        return self.stake[:n] * self.calibration[:n] * self.tier_mult[:n]
+    
+    def _grow(self, capacity: int):
+        for name in ("stake", "calibration", "tier_mult", "max_cases", "cases", "last_active"):
+            column = np.zeros(capacity, dtype=np.float64)
+            old = getattr(self, name)
+            column[:old.size] = old
+            setattr(self, name, column)
+
+
 @dataclass
 class Vote:
     """A validator's vote on a dispute."""
@@ -94,7 +217,7 @@ class Vote:
     verdict: Verdict
     confidence: float
     reasoning: str
-    submitted_at: datetime = field(default_factory=datetime.utcnow)
+    submitted_at: float = field(default_factory=time.time)  # epoch seconds
 
 
 @dataclass
@@ -129,7 +252,17 @@ class ValidatorConsensus:
         self.validators: Dict[str, ValidatorState] = {}
         self.active_disputes: Dict[str, Dict] = {}  # dispute_id -> dispute state
         self.dispute_votes: Dict[str, List[Vote]] = {}  # dispute_id -> votes
-        self.epoch_start: datetime = datetime.utcnow()
+        self.dispute_voters: Dict[str, Set[str]] = {}  # dispute_id -> hotkeys that voted
+        # Running per-verdict weight, folded in as votes arrive
+        self.dispute_weight_accum: Dict[str, np.ndarray] = {}  # dispute_id -> weight per verdict index
+        self.dispute_total_weight: Dict[str, float] = {}  # dispute_id -> summed weight
+        self.epoch_start: float = time.time()
+        self._columns = _ValidatorColumns()
+        self._deadline_heap: List[Tuple[float, str]] = []  # (adjudication deadline, dispute_id)
+        # Disputes whose whole panel has voted, in the order they completed
+        self._ready: Dict[str, None] = {}
+        # Called with a dispute_id as it becomes ready, e.g. to wake a finalizer
+        self.on_ready: Optional[Callable[[str], None]] = None
     
     # ========================================================================
     # Validator Management
@@ -152,7 +285,11 @@ class ValidatorConsensus:
             tier=tier,
             stake=stake
         )
+        previous = self.validators.get(hotkey)
+        if previous is not None:
+            self._columns.detach(previous)
         self.validators[hotkey] = validator
+        self._columns.attach(validator)
         return validator
     
     def get_validator(self, hotkey: str) -> Optional[ValidatorState]:
@@ -181,49 +318,48 @@ class ValidatorConsensus:
         else:
             alignment = 1 - confidence  # Penalize high confidence when wrong
         
-        # Add to history
-        validator.verdict_history.append({
-            "timestamp": datetime.utcnow(),
-            "correct": was_correct,
-            "confidence": confidence,
-            "alignment": alignment
-        })
-        
-        # Recalculate calibration with exponential decay weighting
-        self._recalculate_calibration(validator)
+        # Fold into calibration with exponential decay weighting
+        score = alignment if was_correct else alignment * 0.5
+        self._update_calibration_ema(validator, score)
         
         # Check tier demotion
         self._check_tier_status(validator)
     
-    def _recalculate_calibration(self, validator: ValidatorState):
-        """Recalculate calibration with time-weighted history."""
-        if not validator.verdict_history:
-            return
-        
-        now = datetime.utcnow()
-        weighted_sum = 0.0
-        weight_total = 0.0
-        
-        for entry in validator.verdict_history:
-            # Exponential decay weight
-            age_days = (now - entry["timestamp"]).days
-            weight = math.exp(-age_days / CALIBRATION_TIME_CONSTANT_DAYS)
-            
-            score = entry["alignment"] if entry["correct"] else entry["alignment"] * 0.5
-            weighted_sum += score * weight
-            weight_total += weight
-        
+    def _update_calibration_ema(self, validator: ValidatorState, score: float):
+        """Fold one verdict score into the time-weighted calibration."""
+        now = time.time()
+        if validator.last_verdict_ts is not None:
+            # Age every earlier verdict by the time since the last one
+            age_days = (now - validator.last_verdict_ts) / SECONDS_PER_DAY
+            decay = math.exp(-age_days / CALIBRATION_TIME_CONSTANT_DAYS)
+            validator.calibration_weighted_sum *= decay
+            validator.calibration_weight_total *= decay
+        validator.last_verdict_ts = now
+        
+        validator.calibration_weighted_sum += score
+        validator.calibration_weight_total += 1.0
+        
+        weighted_sum = validator.calibration_weighted_sum
+        weight_total = validator.calibration_weight_total
         if weight_total > 0:
             validator.calibration_score = min(1.5, max(0.3, weighted_sum / weight_total))
     
     def apply_calibration_decay(self):
         """Apply epoch calibration decay to inactive validators."""
-        now = datetime.utcnow()
-        for validator in self.validators.values():
-            days_inactive = (now - validator.last_active).days
-            if days_inactive > 7:
-                decay = CALIBRATION_DECAY_PER_EPOCH * (days_inactive // 7)
-                validator.calibration_score = max(0.5, validator.calibration_score - decay)
+        columns = self._columns
+        n = len(columns.hotkeys)
+        days_inactive = np.floor((time.time() - columns.last_active[:n]) / SECONDS_PER_DAY)
+        
+        stale = np.flatnonzero(days_inactive > 7)
+        if stale.size == 0:
+            return
+        
+        decay = CALIBRATION_DECAY_PER_EPOCH * (days_inactive[stale] // 7)
+        decayed = np.maximum(0.5, columns.calibration[stale] - decay)
+        
+        # Write back through ValidatorState so cached weights follow
+        for row, score in zip(stale.tolist(), decayed.tolist()):
+            self.validators[columns.hotkeys[row]].calibration_score = score
     
     def _check_tier_status(self, validator: ValidatorState):
         """Check if validator should be demoted."""
@@ -235,7 +371,7 @@ class ValidatorConsensus:
                 validator.tier = ValidatorTier.AUDITOR
             elif validator.tier == ValidatorTier.AUDITOR:
                 validator.tier = ValidatorTier.SCOUT
-            validator.tier_start_date = datetime.utcnow()
+            validator.tier_start_date = time.time()
     
     def check_tier_promotion(self, hotkey: str) -> Optional[ValidatorTier]:
         """Check if validator qualifies for tier promotion."""
@@ -243,11 +379,11 @@ class ValidatorConsensus:
         if not validator:
             return None
         
-        now = datetime.utcnow()
+        now = time.time()
         
         # Scout -> Auditor requirements
         if validator.tier == ValidatorTier.SCOUT:
-            days_active = (now - validator.tier_start_date).days
+            days_active = (now - validator.tier_start_date) // SECONDS_PER_DAY
             if (days_active >= 30 and 
                 validator.calibration_score >= 0.7 and
                 validator.verdicts_submitted >= 50 and
@@ -258,8 +394,8 @@ class ValidatorConsensus:
         
         # Auditor -> Arbiter requirements
         elif validator.tier == ValidatorTier.AUDITOR:
-            days_active = (now - validator.tier_start_date).days
-            recent_slashes = [s for s in validator.slashing_events if (now - s).days < 60]
+            days_active = (now - validator.tier_start_date) // SECONDS_PER_DAY
+            recent_slashes = [s for s in validator.slashing_events if (now - s) // SECONDS_PER_DAY < 60]
             
             if (days_active >= 90 and
                 validator.calibration_score >= 0.85 and
@@ -287,51 +423,38 @@ class ValidatorConsensus:
         
         Uses weighted random selection based on tier and availability.
         """
-        eligible = [
-            v for v in self.validators.values()
-            if v.can_take_case and v.calibration_score >= 0.5
-        ]
+        columns = self._columns
+        n = len(columns.hotkeys)
+        eligible = np.flatnonzero(
+            (columns.cases[:n] < columns.max_cases[:n]) & (columns.calibration[:n] >= 0.5)
+        )
         
-        if not eligible:
+        if eligible.size == 0:
             return []
         
-        # Weight by effective weight
-        weights = [v.effective_weight for v in eligible]
-        total_weight = sum(weights)
-        probabilities = [w / total_weight for w in weights]
+        # Weighted selection without replacement via Gumbel top-k: perturb
+        # log-weights once and keep the k largest keys
+        weights = columns.effective_weights()[eligible]
+        keys = np.log(weights) - np.log(-np.log(np.random.random(weights.size)))
         
-        # Select validators (without replacement)
-        selected = []
-        available = list(eligible)
-        available_probs = list(probabilities)
-        
-        for _ in range(min(num_validators, len(available))):
-            if not available:
-                break
-            
-            # Normalize probabilities
-            prob_sum = sum(available_probs)
-            normalized = [p / prob_sum for p in available_probs]
-            
-            # Select one
-            r = random.random()
-            cumsum = 0
-            for i, p in enumerate(normalized):
-                cumsum += p
-                if r <= cumsum:
-                    selected.append(available[i].hotkey)
-                    available.pop(i)
-                    available_probs.pop(i)
-                    break
+        k = min(num_validators, eligible.size)
+        top = np.argpartition(-keys, k - 1)[:k] if k < eligible.size else np.arange(k)
+        top = top[np.argsort(-keys[top])]
+        selected = [columns.hotkeys[i] for i in eligible[top]]
         
         # Track assignment
+        deadline = time.time() + ADJUDICATION_WINDOW_HOURS * SECONDS_PER_HOUR
         self.active_disputes[dispute_id] = {
             "dispute": dispute,
             "assigned_validators": selected,
-            "deadline": datetime.utcnow() + timedelta(hours=ADJUDICATION_WINDOW_HOURS),
+            "deadline": deadline,
             "escalated": False
         }
+        heapq.heappush(self._deadline_heap, (deadline, dispute_id))
         self.dispute_votes[dispute_id] = []
+        self.dispute_voters[dispute_id] = set()
+        self.dispute_weight_accum[dispute_id] = np.zeros(len(_VERDICTS))
+        self.dispute_total_weight[dispute_id] = 0.0
         
         # Update validator case counts
         for hotkey in selected:
@@ -365,28 +488,49 @@ class ValidatorConsensus:
         if validator_hotkey not in dispute_state["assigned_validators"]:
             return False, "Validator not assigned to this dispute"
         
-        if datetime.utcnow() > dispute_state["deadline"]:
+        if time.time() > dispute_state["deadline"]:
             return False, "Adjudication window closed"
         
         # Check for duplicate vote
-        existing = [v for v in self.dispute_votes[dispute_id] if v.validator_hotkey == validator_hotkey]
-        if existing:
+        voters = self.dispute_voters[dispute_id]
+        if validator_hotkey in voters:
             return False, "Already voted on this dispute"
         
+        # Clamp to [0, 1]; written so NaN falls through to 0.0
+        confidence = 1.0 if confidence > 1.0 else confidence if confidence > 0.0 else 0.0
+        
         vote = Vote(
             validator_hotkey=validator_hotkey,
             verdict=verdict,
-            confidence=min(1.0, max(0.0, confidence)),
+            confidence=confidence,
             reasoning=reasoning
         )
+        voters.add(validator_hotkey)
         self.dispute_votes[dispute_id].append(vote)
+        self._accumulate_vote(dispute_id, vote)
+        
+        # Nothing more can change once the whole panel has voted
+        if len(voters) == len(dispute_state["assigned_validators"]):
+            self._ready[dispute_id] = None
+            if self.on_ready is not None:
+                self.on_ready(dispute_id)
         
         # Update validator activity
         if validator_hotkey in self.validators:
-            self.validators[validator_hotkey].last_active = datetime.utcnow()
+            self.validators[validator_hotkey].last_active = time.time()
         
         return True, None
     
+    def _accumulate_vote(self, dispute_id: str, vote: Vote):
+        """Fold a vote's weight into the dispute's running verdict totals."""
+        validator = self.validators.get(vote.validator_hotkey)
+        if not validator:
+            return
+        
+        weight = validator.effective_weight * vote.confidence
+        self.dispute_weight_accum[dispute_id][_VERDICT_INDEX[vote.verdict]] += weight
+        self.dispute_total_weight[dispute_id] += weight
+    
     def calculate_consensus(self, dispute_id: str) -> Optional[ConsensusResult]:
         """
         Calculate weighted consensus from votes.
@@ -407,18 +551,9 @@ class ValidatorConsensus:
                 participating_validators=[]
             )
         
-        # Calculate weighted votes per verdict
-        verdict_weights: Dict[Verdict, float] = {v: 0.0 for v in Verdict}
-        total_weight = 0.0
-        
-        for vote in votes:
-            validator = self.validators.get(vote.validator_hotkey)
-            if not validator:
-                continue
-            
-            weight = validator.effective_weight * vote.confidence
-            verdict_weights[vote.verdict] += weight
-            total_weight += weight
+        # Weighted votes per verdict, maintained by submit_vote
+        verdict_weights = self.dispute_weight_accum[dispute_id]
+        total_weight = self.dispute_total_weight[dispute_id]
         
         # Find winning verdict
         if total_weight == 0:
@@ -427,20 +562,21 @@ class ValidatorConsensus:
                 final_verdict=Verdict.ABSTAIN,
                 weighted_score=0.0,
                 total_weight=0.0,
-                vote_breakdown=verdict_weights,
+                vote_breakdown=dict(zip(_VERDICTS, verdict_weights.tolist())),
                 participating_validators=[v.validator_hotkey for v in votes]
             )
         
         # Normalize
-        vote_breakdown = {k: v / total_weight for k, v in verdict_weights.items()}
+        shares = verdict_weights / total_weight
+        vote_breakdown = dict(zip(_VERDICTS, shares.tolist()))
         
-        # Find winner
-        winner = max(vote_breakdown.items(), key=lambda x: x[1])
+        # Find winner (first verdict on ties)
+        winner = int(shares.argmax())
         
         return ConsensusResult(
             dispute_id=dispute_id,
-            final_verdict=winner[0],
-            weighted_score=winner[1],
+            final_verdict=_VERDICTS[winner],
+            weighted_score=float(shares[winner]),
             total_weight=total_weight,
             vote_breakdown=vote_breakdown,
             participating_validators=[v.validator_hotkey for v in votes]
@@ -467,9 +603,51 @@ class ValidatorConsensus:
         
         # Clean up
         del self.active_disputes[dispute_id]
+        del self.dispute_weight_accum[dispute_id]
+        del self.dispute_total_weight[dispute_id]
+        del self.dispute_voters[dispute_id]
         
         return result
     
+    def pop_ready_disputes(self) -> List[str]:
+        """
+        Take the disputes whose whole panel has voted since the last call.
+        
+        Disputes finalized or escalated in the meantime are skipped; an
+        escalated panel becomes ready again once its arbiters have voted.
+        """
+        ready = [
+            dispute_id for dispute_id in self._ready
+            if dispute_id in self.active_disputes
+            and len(self.dispute_voters[dispute_id]) == len(self.active_disputes[dispute_id]["assigned_validators"])
+        ]
+        self._ready.clear()
+        return ready
+    
+    def finalize_expired_disputes(self) -> List[ConsensusResult]:
+        """
+        Finalize every dispute whose adjudication window has closed.
+        
+        Only heap entries whose deadline has passed are visited. Entries for
+        disputes finalized early, or whose deadline moved on escalation, are
+        stale and simply dropped. Disputes that escalate here get a fresh
+        deadline, and disputes that find no arbiter to escalate to are
+        retried every ARBITER_RETRY_SECONDS; later sweeps pick both up.
+        """
+        results = []
+        now = time.time()
+        heap = self._deadline_heap
+        
+        while heap and heap[0][0] < now:
+            deadline, dispute_id = heapq.heappop(heap)
+            dispute_state = self.active_disputes.get(dispute_id)
+            if dispute_state and dispute_state["deadline"] == deadline:
+                result = self.finalize_dispute(dispute_id)
+                if result:
+                    results.append(result)
+        
+        return results
+    
     def escalate_to_arbiters(self, dispute_id: str) -> ConsensusResult:
         """
         Escalate dispute to Arbiter-only panel.
@@ -480,19 +658,25 @@ class ValidatorConsensus:
         
         # Find all Arbiters
         arbiters = [
-            v for v in self.validators.values()
-            if v.tier == ValidatorTier.ARBITER and v.can_take_case
+            self.validators[hotkey] for hotkey in self._columns.by_tier[ValidatorTier.ARBITER]
+            if self.validators[hotkey].can_take_case
         ]
         
         if not arbiters:
-            # No arbiters available - use existing votes
+            # No arbiters available - use existing votes, and retry the
+            # escalation once the window (or this retry delay) has passed
+            retry_at = time.time() + ARBITER_RETRY_SECONDS
+            if retry_at > dispute_state["deadline"]:
+                dispute_state["deadline"] = retry_at
+                heapq.heappush(self._deadline_heap, (retry_at, dispute_id))
             result = self.calculate_consensus(dispute_id)
             result.escalated = True
             return result
         
         # Mark as escalated
         dispute_state["escalated"] = True
-        dispute_state["deadline"] = datetime.utcnow() + timedelta(hours=ESCALATION_WINDOW_HOURS)
+        dispute_state["deadline"] = time.time() + ESCALATION_WINDOW_HOURS * SECONDS_PER_HOUR
+        heapq.heappush(self._deadline_heap, (dispute_state["deadline"], dispute_id))
         dispute_state["assigned_validators"] = [a.hotkey for a in arbiters]
         
         # Clear non-Arbiter votes for re-vote
@@ -502,6 +686,20 @@ class ValidatorConsensus:
             if v.validator_hotkey in arbiter_hotkeys
         ]
         
+        self.dispute_voters[dispute_id] &= arbiter_hotkeys
+        
+        # Rebuild running totals from the surviving Arbiter votes
+        self.dispute_weight_accum[dispute_id] = np.zeros(len(_VERDICTS))
+        self.dispute_total_weight[dispute_id] = 0.0
+        for vote in self.dispute_votes[dispute_id]:
+            self._accumulate_vote(dispute_id, vote)
+        
+        # Every arbiter may already have voted in the first round
+        if len(self.dispute_voters[dispute_id]) == len(arbiter_hotkeys):
+            self._ready[dispute_id] = None
+            if self.on_ready is not None:
+                self.on_ready(dispute_id)
+        
         return ConsensusResult(
             dispute_id=dispute_id,
             final_verdict=Verdict.ABSTAIN,  # Pending
@@ -518,7 +716,7 @@ class ValidatorConsensus:
     
     def new_epoch(self):
         """Reset epoch-specific counters."""
-        self.epoch_start = datetime.utcnow()
+        self.epoch_start = time.time()
         for validator in self.validators.values():
             validator.cases_this_epoch = 0
         self.apply_calibration_decay()
@@ -540,7 +738,7 @@ class ValidatorConsensus:
             "accuracy": validator.correct_verdicts / validator.verdicts_submitted if validator.verdicts_submitted > 0 else 0,
             "cases_this_epoch": validator.cases_this_epoch,
             "can_take_case": validator.can_take_case,
-            "last_active": validator.last_active.isoformat(),
+            "last_active": datetime.fromtimestamp(validator.last_active, tz=timezone.utc).replace(tzinfo=None).isoformat(),
         }
 ```
 
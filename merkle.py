@@ -5,43 +5,66 @@ Merkle Tree Implementation for Reasoning Trees
 
 Provides cryptographic commitment to reasoning structure,
 enabling efficient O(log n) verification of contested branches.
+
+Hashes are raw 32-byte SHA-256 digests internally; roots and proof
+hashes are exposed as hex strings.
 """
 
 import hashlib
-import json
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
-
 
-@dataclass
-class MerkleNode:
-    """A node in the Merkle tree."""
-    hash: str
-    data_id: Optional[str] = None  # Corresponding reasoning node ID
-    left: Optional['MerkleNode'] = None
-    right: Optional['MerkleNode'] = None
+import orjson
 
 
-def hash_data(data: str) -> str:
+def hash_data(data: bytes) -> bytes:
     """Hash data using SHA-256."""
-    return hashlib.sha256(data.encode()).hexdigest()
+    return hashlib.sha256(data).digest()
+
+
+# Node and evidence fields covered by the commitment. Anything else a node
+# dict carries (synapse transport fields, merkle_hash itself) is ignored.
+NODE_FIELDS = ("id", "claim", "node_type", "evidence", "children")
+EVIDENCE_FIELDS = ("source", "data", "url", "timestamp")
+# pydantic include spec that dumps only the committed fields of a node
+NODE_DUMP_INCLUDE = {**{f: True for f in NODE_FIELDS}, "evidence": set(EVIDENCE_FIELDS)}
+
+
+def committed_fields(node_data: Dict) -> Dict:
+    """The part of a node dict that the commitment covers."""
+    committed = {f: node_data.get(f) for f in NODE_FIELDS}
+    evidence = committed["evidence"]
+    if evidence is not None:
+        committed["evidence"] = {f: evidence.get(f) for f in EVIDENCE_FIELDS}
+    return committed
 
 
-def hash_node(node_data: Dict) -> str:
+def encode_node(node_data: Dict) -> bytes:
+    """Canonical encoding of a node's committed fields (compact, sorted-key JSON)."""
+    return orjson.dumps(committed_fields(node_data), option=orjson.OPT_SORT_KEYS)
+
+
+def hash_node(node_data: Dict) -> bytes:
     """
     Hash a reasoning node for Merkle commitment.
     
     Includes: id, claim, node_type, evidence, children
     """
-    # Canonical JSON for consistent hashing
-    canonical = json.dumps(node_data, sort_keys=True, separators=(',', ':'))
-    return hash_data(canonical)
+    return hash_data(encode_node(node_data))
+
+
+def digest_nodes(encoded_nodes: List[bytes]) -> bytes:
+    """
+    Single SHA-256 over a node list's encode_node outputs.
+    
+    Identifies the exact content a Merkle root would be built from, at the
+    cost of one hash instead of a full tree build.
+    """
+    return hash_data(b"".join(encoded_nodes))
 
 
-def combine_hashes(left: str, right: str) -> str:
+def combine_hashes(left: bytes, right: bytes) -> bytes:
     """Combine two hashes into a parent hash."""
-    combined = left + right
-    return hash_data(combined)
+    return hash_data(left + right)
 
 
 class ReasoningMerkleTree:
@@ -55,91 +78,91 @@ class ReasoningMerkleTree:
     """
     
     def __init__(self):
-        self.root: Optional[MerkleNode] = None
-        self.nodes: Dict[str, str] = {}  # node_id -> hash
-        self.proofs: Dict[str, List[Tuple[str, str]]] = {}  # node_id -> proof path
+        self.nodes: Dict[str, bytes] = {}  # node_id -> hash
+        self.proofs: Dict[str, List[Tuple[str, str]]] = {}  # node_id -> proof path (hex hashes)
+        self.levels: List[List[bytes]] = []  # levels[0] = leaf hashes, levels[-1] = [root]
+        self.leaf_index: Dict[str, int] = {}  # node_id -> position in levels[0]
     
-    def build_from_reasoning_tree(self, reasoning_nodes: List[Dict]) -> str:
+    def build_from_reasoning_tree(
+        self,
+        reasoning_nodes: List[Dict],
+        encoded_nodes: Optional[List[bytes]] = None
+    ) -> str:
         """
         Build Merkle tree from reasoning nodes.
         
         Args:
             reasoning_nodes: List of reasoning node dictionaries
+            encoded_nodes: encode_node output per node, if the caller already
+                has it; saves serializing every node a second time
             
         Returns:
-            Merkle root hash
+            Merkle root hash (hex)
         """
         if not reasoning_nodes:
-            return hash_data("")
+            return hash_data(b"").hex()
         
         # Hash each reasoning node
         leaves = []
-        for node in reasoning_nodes:
-            node_hash = hash_node(node)
+        for i, node in enumerate(reasoning_nodes):
+            node_hash = hash_node(node) if encoded_nodes is None else hash_data(encoded_nodes[i])
             self.nodes[node['id']] = node_hash
-            leaves.append(MerkleNode(hash=node_hash, data_id=node['id']))
+            self.leaf_index[node['id']] = i
+            leaves.append(node_hash)
         
         # Build tree bottom-up
-        self.root = self._build_tree(leaves)
+        root = self._build_tree(leaves)
         
         # Generate proofs for each node
         for node_id in self.nodes:
             self.proofs[node_id] = self._generate_proof(node_id)
         
-        return self.root.hash
+        return root.hex()
     
-    def _build_tree(self, nodes: List[MerkleNode]) -> MerkleNode:
-        """Recursively build tree from leaf nodes."""
-        if len(nodes) == 1:
-            return nodes[0]
-        
-        # Pad to even number
-        if len(nodes) % 2 == 1:
-            nodes.append(nodes[-1])
-        
-        # Build parent level
-        parents = []
-        for i in range(0, len(nodes), 2):
-            left = nodes[i]
-            right = nodes[i + 1]
-            parent_hash = combine_hashes(left.hash, right.hash)
-            parents.append(MerkleNode(hash=parent_hash, left=left, right=right))
-        
-        return self._build_tree(parents)
+    def _build_tree(self, leaves: List[bytes]) -> bytes:
+        """
+        Build tree bottom-up from leaf hashes, one level per iteration.
+        
+        Records each level's hashes in self.levels (after padding) and
+        returns the root hash.
+        """
+        sha256 = hashlib.sha256
+        level = leaves
+        self.levels = [level]
+        
+        while len(level) > 1:
+            # Pad to even number
+            if len(level) % 2 == 1:
+                level.append(level[-1])
+            
+            # Build parent level, pairing siblings straight off an iterator
+            # (same as combine_hashes, without the per-pair call overhead)
+            pairs = iter(level)
+            level = [sha256(left + right).digest() for left, right in zip(pairs, pairs)]
+            self.levels.append(level)
+        
+        return level[0]
     
     def _generate_proof(self, node_id: str) -> List[Tuple[str, str]]:
         """
         Generate Merkle proof for a specific node.
         
-        Returns list of (hash, direction) tuples.
+        Returns list of (hex hash, direction) tuples.
+        
+        Walks self.levels from the leaf upward, taking the sibling at each
+        level, so each proof is O(log n).
         """
-        if node_id not in self.nodes:
+        if node_id not in self.leaf_index:
             return []
         
-        target_hash = self.nodes[node_id]
+        i = self.leaf_index[node_id]
         proof = []
         
-        def find_and_prove(node: Optional[MerkleNode], target: str) -> bool:
-            if node is None:
-                return False
-            if node.hash == target and node.data_id == node_id:
-                return True
-            
-            # Check left subtree
-            if node.left and find_and_prove(node.left, target):
-                if node.right:
-                    proof.append((node.right.hash, "right"))
-                return True
-            
-            # Check right subtree
-            if node.right and find_and_prove(node.right, target):
-                if node.left:
-                    proof.append((node.left.hash, "left"))
-                return True
-            
-            return False
+        for level in self.levels[:-1]:
+            sibling = i ^ 1
+            proof.append((level[sibling].hex(), "left" if sibling < i else "right"))
+            i >>= 1
         
-        find_and_prove(self.root, target_hash)
         return proof
     
     def get_proof(self, node_id: str) -> Optional[List[Tuple[str, str]]]:
@@ -157,8 +180,8 @@ class ReasoningMerkleTree:
         
         Args:
             node_data: The reasoning node to verify
-            proof: List of (sibling_hash, direction) tuples
-            root_hash: Expected root hash
+            proof: List of (sibling_hash, direction) tuples, hashes in hex
+            root_hash: Expected root hash (hex)
             
         Returns:
             True if proof is valid
@@ -166,16 +189,17 @@ class ReasoningMerkleTree:
         current_hash = hash_node(node_data)
         
         for sibling_hash, direction in proof:
+            sibling = bytes.fromhex(sibling_hash)
             if direction == "left":
-                current_hash = combine_hashes(sibling_hash, current_hash)
+                current_hash = combine_hashes(sibling, current_hash)
             else:
-                current_hash = combine_hashes(current_hash, sibling_hash)
+                current_hash = combine_hashes(current_hash, sibling)
         
-        return current_hash == root_hash
+        return current_hash.hex() == root_hash
     
     def get_root(self) -> Optional[str]:
-        """Get the Merkle root hash."""
-        return self.root.hash if self.root else None
+        """Get the Merkle root hash (hex)."""
+        return self.levels[-1][0].hex() if self.levels else None
 
 
 def create_merkle_commitment(reasoning_tree: Dict) -> Tuple[str, Dict[str, List]]:
@@ -193,13 +217,12 @@ def create_merkle_commitment(reasoning_tree: Dict) -> Tuple[str, Dict[str, List]
     # Collect all nodes
     all_nodes = [reasoning_tree['root']] + reasoning_tree.get('nodes', [])
     
-    # Convert to dicts if needed
-    nodes_as_dicts = []
-    for node in all_nodes:
-        if hasattr(node, 'dict'):
-            nodes_as_dicts.append(node.dict())
-        else:
-            nodes_as_dicts.append(node)
+    # A tree's nodes are all models or all dicts; check once, and dump only
+    # the committed fields of models
+    if hasattr(all_nodes[0], 'model_dump'):
+        nodes_as_dicts = [node.model_dump(include=NODE_DUMP_INCLUDE) for node in all_nodes]
+    else:
+        nodes_as_dicts = all_nodes
     
     merkle_root = tree.build_from_reasoning_tree(nodes_as_dicts)
     
@@ -9,10 +9,16 @@ Earns rewards for successful challenges.
 
 import argparse
 import asyncio
+import hashlib
+import heapq
+import re
+import time
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Dict, List, Tuple
 
 import bittensor as bt
+import numpy as np
 
 # Add parent to path for imports
 import sys
@@ -22,6 +28,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from dialectic.protocol import (
     ReasoningTree,
     ReasoningNode,
+    NodeType,
+    NODE_TYPE_CODES,
     ChallengeSubmission,
     Evidence,
     AttackType,
@@ -35,6 +43,83 @@ from dialectic.challenge import (
 )
 
 
+# Entries kept in the shared verification cache before LRU eviction
+CHECK_CACHE_SIZE = 4096
+# Trees whose claim buckets are kept for contradiction checks
+BUCKET_CACHE_SIZE = 64
+# Accepted challenges tracked before the oldest are dropped
+PENDING_CHALLENGES_SIZE = 10_000
+# Past challenge records kept
+CHALLENGE_HISTORY_SIZE = 5000
+# Fetched trees waiting for analysis
+TREE_QUEUE_SIZE = 2
+
+_CONCLUSION_CODE = NODE_TYPE_CODES[NodeType.CONCLUSION]
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({
+    "a", "an", "the", "this", "that", "these", "those", "it", "its",
+    "of", "in", "on", "for", "to", "by", "with", "and", "or", "not", "no",
+    "is", "are", "was", "were", "be", "will", "would", "should", "can", "could",
+})
+
+# Wording that typically carries a fallacious inference (generalizations,
+# false dilemmas, appeals to authority or popularity, slippery slopes)
+_FALLACY_MARKERS = re.compile(
+    r"\b(always|never|every(one|body)?|no ?one|nobody|all|none|obviously|clearly|"
+    r"must|therefore|thus|hence|so|because|since|either|only|inevitabl[ey]|"
+    r"experts?|everybody knows|popular|lead to|will cause)\b",
+    re.IGNORECASE,
+)
+
+
+def _claim_key(claim: str) -> str:
+    """Cheap subject key for a claim: its first non-stopword token."""
+    for word in _WORD_RE.findall(claim.lower()):
+        if word not in _STOPWORDS:
+            return word
+    return ""
+
+
+def _check_key(parts: Tuple[str, ...]) -> str:
+    """Cache key for a check: SHA-256 over its name and inputs."""
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+async def _none() -> None:
+    """Placeholder awaitable for checks that do not apply to a node."""
+    return None
+
+
+class _TokenBucket:
+    """
+    Async rate limiter: `async with bucket` waits for a token.
+    
+    Tokens refill continuously at `rate` per second up to `burst`.
+    """
+    
+    def __init__(self, rate: float, burst: float = 1.0):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    async def __aexit__(self, *exc):
+        return False
+
+
 class ChallengeCandidate:
     """A potential challenge identified during analysis."""
     def __init__(
@@ -83,15 +168,38 @@ class Challenger:
         self.subtensor = bt.subtensor(config=config)
         self.metagraph = self.subtensor.metagraph(netuid=config.netuid)
         self.dendrite = bt.dendrite(wallet=self.wallet)
+        self._hotkey = self.wallet.hotkey.ss58_address
         
         # Challenger parameters
         self.min_ev = config.min_ev if hasattr(config, 'min_ev') else 0.5
         self.max_stake_per_challenge = config.max_stake if hasattr(config, 'max_stake') else 50.0
         self.min_confidence = config.min_confidence if hasattr(config, 'min_confidence') else 0.6
+        self.max_concurrency = config.max_concurrency if hasattr(config, 'max_concurrency') else 8
+        self.max_challenges_per_tree = config.max_challenges_per_tree if hasattr(config, 'max_challenges_per_tree') else 5
+        self.fallacy_prefilter = config.fallacy_prefilter if hasattr(config, 'fallacy_prefilter') else False
+        self.max_inflight = config.max_inflight if hasattr(config, 'max_inflight') else 4
+        self.max_per_sec = config.max_per_sec if hasattr(config, 'max_per_sec') else 1.0
+        
+        # Caps in-flight verification calls across all nodes being analyzed
+        self._check_semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        # Challenge submissions: at most max_inflight at once, max_per_sec started per second
+        self._submit_semaphore = asyncio.Semaphore(self.max_inflight)
+        self._submit_rate = _TokenBucket(self.max_per_sec)
         
-        # State
-        self.pending_challenges: Dict[str, ChallengeSubmission] = {}
-        self.challenge_history: List[Dict] = []
+        # Verification results by content digest (LRU), plus calls still in
+        # flight so concurrent duplicates share one call
+        self._check_cache: OrderedDict[str, Any] = OrderedDict()
+        self._check_inflight: Dict[str, asyncio.Future] = {}
+        # Claim buckets per tree, keyed by Merkle root (LRU)
+        self._bucket_cache: OrderedDict[str, Dict[str, List[ReasoningNode]]] = OrderedDict()
+        
+        # Validator UIDs for the current metagraph sync (see _get_validator_uids)
+        self._validator_uids: Optional[List[int]] = None
+        
+        # State, bounded so a long-running neuron doesn't grow without limit
+        self.pending_challenges: OrderedDict[str, ChallengeSubmission] = OrderedDict()
+        self.challenge_history: deque = deque(maxlen=CHALLENGE_HISTORY_SIZE)
         
         # Specialization domains (if any)
         self.domains = config.domains.split(",") if hasattr(config, 'domains') and config.domains else []
@@ -102,41 +210,80 @@ class Challenger:
         """
         Analyze a reasoning tree for potential challenges.
         
-        Returns a list of ChallengeCandidate objects sorted by expected value.
+        Returns up to max_challenges_per_tree ChallengeCandidate objects that
+        meet min_ev and min_confidence, sorted by expected value.
         """
-        candidates = []
+        # Skip conclusions (derived from premises)
+        view = tree.view
+        nodes = view.select(view.types != _CONCLUSION_CODE)
         
-        # Analyze each node
-        all_nodes = [tree.root] + tree.nodes
+        # Verify the whole tree's evidence in one batch up front
+        evidence_results = await self._verify_tree_evidence(nodes)
         
-        for node in all_nodes:
-            # Skip conclusions (derived from premises)
-            if node.node_type.value == "conclusion":
-                continue
-            
-            # Check for various attack vectors
-            attacks = await self.find_attack_vectors(tree, node)
-            candidates.extend(attacks)
+        # Check every node concurrently
+        results = await asyncio.gather(*[
+            self.find_attack_vectors(tree, node, evidence_results)
+            for node in nodes
+        ])
+        candidates = [attack for attacks in results for attack in attacks]
+        
+        # Keep the best qualifying candidates by expected value
+        return heapq.nlargest(
+            self.max_challenges_per_tree,
+            (c for c in candidates if c.ev >= self.min_ev and c.confidence >= self.min_confidence),
+            key=lambda x: x.ev
+        )
+    
+    async def analyze_tree_stream(self, tree: ReasoningTree) -> AsyncIterator[ChallengeCandidate]:
+        """
+        Analyze a reasoning tree, yielding candidates as each node finishes.
         
-        # Sort by expected value
-        candidates.sort(key=lambda x: x.ev, reverse=True)
+        Yields up to max_challenges_per_tree candidates that meet min_ev and
+        min_confidence, in completion order rather than by expected value,
+        so callers can act on fast findings while slower checks still run.
+        """
+        view = tree.view
+        nodes = view.select(view.types != _CONCLUSION_CODE)
+        evidence_results = await self._verify_tree_evidence(nodes)
         
-        return candidates
+        tasks = [
+            asyncio.ensure_future(self.find_attack_vectors(tree, node, evidence_results))
+            for node in nodes
+        ]
+        emitted = 0
+        try:
+            for fut in asyncio.as_completed(tasks):
+                for c in await fut:
+                    if c.ev >= self.min_ev and c.confidence >= self.min_confidence:
+                        yield c
+                        emitted += 1
+                        if emitted >= self.max_challenges_per_tree:
+                            return
+        finally:
+            # Drop analyses nobody will consume
+            for task in tasks:
+                task.cancel()
     
     async def find_attack_vectors(
         self, 
         tree: ReasoningTree, 
-        node: ReasoningNode
+        node: ReasoningNode,
+        evidence_results: Optional[Dict[str, Dict]] = None
     ) -> List[ChallengeCandidate]:
         """
         Identify potential attack vectors for a node.
         
+        evidence_results maps node IDs to verification results already
+        fetched for the tree; without it the node's evidence is verified
+        on its own.
+        
         Override this method for sophisticated attack detection.
         """
         attacks = []
         
         # Check for missing evidence
-        if not node.evidence and node.node_type.value in ["premise", "sub_premise"]:
+        node_type = node.node_type
+        if not node.evidence and (node_type is NodeType.PREMISE or node_type is NodeType.SUB_PREMISE):
             attacks.append(ChallengeCandidate(
                 tree=tree,
                 node=node,
@@ -145,24 +292,36 @@ class Challenger:
                 confidence=0.7
             ))
         
-        # Check for factual claims that can be verified
-        if node.evidence:
-            fact_check = await self.verify_evidence(node)
-            if not fact_check["verified"]:
-                attacks.append(ChallengeCandidate(
-                    tree=tree,
-                    node=node,
-                    attack_type=AttackType.FACTUAL_ERROR,
-                    argument=fact_check["reason"],
-                    evidence=Evidence(
-                        source=fact_check.get("correct_source", "Verification"),
-                        data=fact_check.get("correct_data", "Evidence contradicts claim")
-                    ),
-                    confidence=fact_check.get("confidence", 0.6)
-                ))
+        # Run the independent checks concurrently; with fallacy_prefilter on,
+        # claims may_contain_fallacy rules out skip the fallacy check
+        run_fallacy = not self.fallacy_prefilter or self.may_contain_fallacy(node)
+        fact_check, fallacy, contradiction = await asyncio.gather(
+            self._check_evidence(node, evidence_results) if node.evidence else _none(),
+            self._cached_check(
+                ("fallacy", tree.merkle_root, node.id),
+                lambda: self.check_logical_fallacy(tree, node)
+            ) if run_fallacy else _none(),
+            self._cached_check(
+                ("contradiction", tree.merkle_root, node.id),
+                lambda: self.check_contradictions(tree, node)
+            ),
+        )
         
+        # Check for factual claims that can be verified
+        if fact_check is not None and not fact_check["verified"]:
+            attacks.append(ChallengeCandidate(
+                tree=tree,
+                node=node,
+                attack_type=AttackType.FACTUAL_ERROR,
+                argument=fact_check["reason"],
+                evidence=Evidence(
+                    source=fact_check.get("correct_source", "Verification"),
+                    data=fact_check.get("correct_data", "Evidence contradicts claim")
+                ),
+                confidence=fact_check.get("confidence", 0.6)
+            ))
+    
         # Check for logical fallacies (placeholder)
-        fallacy = await self.check_logical_fallacy(tree, node)
         if fallacy:
             attacks.append(ChallengeCandidate(
                 tree=tree,
@@ -173,7 +332,6 @@ class Challenger:
             ))
         
         # Check for contradictions with other nodes
-        contradiction = await self.check_contradictions(tree, node)
         if contradiction:
             attacks.append(ChallengeCandidate(
                 tree=tree,
@@ -186,6 +344,118 @@ class Challenger:
         
         return attacks
     
+    async def _limited(self, coro):
+        """Await a verification call under the concurrency cap."""
+        async with self._check_semaphore:
+            return await coro
+    
+    async def _check_evidence(self, node: ReasoningNode, evidence_results: Optional[Dict[str, Dict]]):
+        """Verification result for a node's evidence, prefetched or on demand."""
+        if evidence_results is not None and node.id in evidence_results:
+            return evidence_results[node.id]
+        return await self._cached_check(
+            ("evidence", node.claim, node.evidence.source, node.evidence.data),
+            lambda: self.verify_evidence(node)
+        )
+    
+    async def _verify_tree_evidence(self, nodes: List[ReasoningNode]) -> Dict[str, Dict]:
+        """
+        Verify the evidence of a tree's nodes with a single batched call.
+        
+        Items are served from the check cache or an identical call already in
+        flight where possible (so repeated claim/evidence pairs within the
+        tree are verified once); the rest go to verify_evidence_batch together.
+        
+        Returns node ID -> verification result.
+        """
+        loop = asyncio.get_running_loop()
+        cache = self._check_cache
+        by_node: Dict[str, asyncio.Future] = {}
+        batch_nodes, batch_keys, batch_futures = [], [], []
+        
+        for node in nodes:
+            if not node.evidence:
+                continue
+            key = _check_key(("evidence", node.claim, node.evidence.source, node.evidence.data))
+            if key in cache:
+                cache.move_to_end(key)
+                future = loop.create_future()
+                future.set_result(cache[key])
+            elif key in self._check_inflight:
+                future = self._check_inflight[key]
+            else:
+                future = loop.create_future()
+                self._check_inflight[key] = future
+                batch_nodes.append(node)
+                batch_keys.append(key)
+                batch_futures.append(future)
+            by_node[node.id] = future
+        
+        if batch_nodes:
+            try:
+                results = await self._limited(self.verify_evidence_batch(batch_nodes))
+                for key, future, result in zip(batch_keys, batch_futures, results):
+                    self._remember(key, result)
+                    future.set_result(result)
+            except Exception as e:
+                for future in batch_futures:
+                    if not future.done():
+                        future.set_exception(e)
+                        future.exception()  # re-raised below; don't log as unretrieved
+                raise
+            finally:
+                for key, future in zip(batch_keys, batch_futures):
+                    self._check_inflight.pop(key, None)
+                    if not future.done():
+                        future.cancel()
+        
+        return {node_id: await asyncio.shield(future) for node_id, future in by_node.items()}
+    
+    async def _cached_check(self, parts: Tuple[str, ...], call: Callable[[], Awaitable]):
+        """
+        Memoize a verification call on the content it depends on.
+        
+        parts names the check and its inputs (see _check_key).
+        Misses run under the concurrency cap, and a miss already in flight is
+        awaited rather than issued twice. Failures are not cached.
+        """
+        key = _check_key(parts)
+        cache = self._check_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        
+        pending = self._check_inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        pending = asyncio.ensure_future(self._limited(call()))
+        self._check_inflight[key] = pending
+        try:
+            result = await asyncio.shield(pending)
+        finally:
+            del self._check_inflight[key]
+        
+        self._remember(key, result)
+        return result
+    
+    def _remember(self, key: str, result: Any):
+        """Store a verification result, evicting the least recently used."""
+        cache = self._check_cache
+        cache[key] = result
+        if len(cache) > CHECK_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    async def verify_evidence_batch(self, nodes: List[ReasoningNode]) -> List[Dict]:
+        """
+        Verify the evidence of several nodes in one request.
+        
+        Returns one result per node, in order. Override to send the whole
+        batch to a fact-check endpoint; by default each node goes through
+        verify_evidence.
+        """
+        return list(await asyncio.gather(*[self.verify_evidence(node) for node in nodes]))
+    
     async def verify_evidence(self, node: ReasoningNode) -> Dict:
         """
         Verify the evidence cited by a node.
@@ -203,6 +473,18 @@ class Challenger:
             "reason": None
         }
     
+    def may_contain_fallacy(self, node: ReasoningNode) -> bool:
+        """
+        Cheap prefilter for check_logical_fallacy: does the claim use wording
+        that fallacious inferences usually need?
+        
+        Only consulted when fallacy_prefilter is enabled. The keyword scan
+        misses fallacies without these markers, so leave it off for
+        detectors that need to see every claim, or override it alongside
+        check_logical_fallacy.
+        """
+        return _FALLACY_MARKERS.search(node.claim) is not None
+    
     async def check_logical_fallacy(
         self, 
         tree: ReasoningTree, 
@@ -211,6 +493,9 @@ class Challenger:
         """
         Check if the node contains a logical fallacy.
         
+        Results are cached per tree (Merkle root) and node, so overrides may
+        use the surrounding tree, e.g. the premises a node argues from.
+        
         Override for real fallacy detection.
         """
         # Placeholder - in practice, this would use:
@@ -228,15 +513,54 @@ class Challenger:
         """
         Check if the node contradicts other nodes in the tree.
         
+        Only nodes whose claims share a subject key are compared, so the
+        pairwise check runs within buckets rather than across all N² pairs.
+        
         Override for real contradiction detection.
         """
+        key = _claim_key(node.claim)
+        for other in self._claim_buckets(tree).get(key, ()):
+            if other is node:
+                continue
+            contradiction = await self.claims_contradict(node, other)
+            if contradiction:
+                return contradiction
+        
+        return None
+    
+    async def claims_contradict(
+        self,
+        node: ReasoningNode,
+        other: ReasoningNode
+    ) -> Optional[Dict]:
+        """
+        Check whether two same-subject claims conflict.
+        
+        Override for real entailment checking.
+        """
         # Placeholder - in practice, this would:
-        # 1. Compare claims across all nodes
-        # 2. Use entailment models to detect conflicts
-        # 3. Check for temporal/logical inconsistencies
+        # 1. Use entailment models to detect conflicts
+        # 2. Check for temporal/logical inconsistencies
         
         return None
     
+    def _claim_buckets(self, tree: ReasoningTree) -> Dict[str, List[ReasoningNode]]:
+        """Tree nodes grouped by claim subject key, built once per tree."""
+        cache = self._bucket_cache
+        buckets = cache.get(tree.merkle_root)
+        if buckets is not None:
+            cache.move_to_end(tree.merkle_root)
+            return buckets
+        
+        buckets = defaultdict(list)
+        for node in tree.view.nodes:
+            buckets[_claim_key(node.claim)].append(node)
+        
+        cache[tree.merkle_root] = buckets
+        if len(cache) > BUCKET_CACHE_SIZE:
+            cache.popitem(last=False)
+        return buckets
+    
     async def submit_challenge(
         self,
         candidate: ChallengeCandidate,
@@ -265,7 +589,7 @@ class Challenger:
             argument=candidate.argument,
             evidence=candidate.evidence,
             stake=stake,
-            challenger_hotkey=self.wallet.hotkey.ss58_address
+            challenger_hotkey=self._hotkey
         )
         
         # Submit to validators
@@ -275,22 +599,31 @@ class Challenger:
             if not validator_uids:
                 return False, "No validators available"
             
-            # Send to first available validator
-            # In practice, would broadcast to multiple
+            # Send to the first few validators at once; the first to accept wins
             axons = [self.metagraph.axons[uid] for uid in validator_uids[:3]]
             
-            responses = await self.dendrite.forward(
-                axons=axons,
-                synapse=challenge,
-                timeout=30
-            )
-            
-            # Check responses
-            for resp in responses:
-                if resp.accepted:
-                    self.pending_challenges[resp.dispute_id] = challenge
-                    bt.logging.info(f"Challenge accepted: {resp.dispute_id}")
-                    return True, resp.dispute_id
+            pending = {
+                asyncio.ensure_future(self.dendrite.forward(axons=axon, synapse=challenge, timeout=30))
+                for axon in axons
+            }
+            try:
+                # Check responses as they arrive
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is not None:
+                            bt.logging.debug(f"Validator forward failed: {task.exception()}")
+                            continue
+                        resp = task.result()
+                        if resp.accepted:
+                            self.pending_challenges[resp.dispute_id] = challenge
+                            if len(self.pending_challenges) > PENDING_CHALLENGES_SIZE:
+                                self.pending_challenges.popitem(last=False)
+                            bt.logging.info(f"Challenge accepted: {resp.dispute_id}")
+                            return True, resp.dispute_id
+            finally:
+                for task in pending:
+                    task.cancel()
             
             return False, "All validators rejected challenge"
             
@@ -298,54 +631,76 @@ class Challenger:
             bt.logging.error(f"Error submitting challenge: {e}")
             return False, str(e)
     
+    async def _submit_limited(self, candidate: ChallengeCandidate):
+        """Submit a candidate under the submission rate limit and in-flight cap."""
+        async with self._submit_rate, self._submit_semaphore:
+            success, result = await self.submit_challenge(candidate)
+        if success:
+            bt.logging.info(f"Submitted challenge: {result}")
+        else:
+            bt.logging.debug(f"Skipped challenge: {result}")
+    
     def _get_validator_uids(self) -> List[int]:
         """Get UIDs of active validators."""
         # In practice, identify validators by stake or role
         # For now, return all UIDs with non-zero stake
-        uids = []
-        for uid in range(len(self.metagraph.S)):
-            if self.metagraph.S[uid] > 0:
-                uids.append(uid)
-        return uids
+        if self._validator_uids is None:
+            self._validator_uids = np.flatnonzero(np.asarray(self.metagraph.S) > 0).tolist()
+        return self._validator_uids
+    
+    def _sync_metagraph(self):
+        """Sync the metagraph and drop the cached validator UIDs."""
+        self.metagraph.sync()
+        self._validator_uids = None
     
     async def run(self):
         """Main loop for the challenger."""
         bt.logging.info("Starting challenger main loop...")
         
+        # Fetching runs ahead of analysis by at most TREE_QUEUE_SIZE trees
+        queue: asyncio.Queue = asyncio.Queue(maxsize=TREE_QUEUE_SIZE)
+        fetcher = asyncio.create_task(self._fetch_loop(queue))
+        
+        try:
+            while True:
+                tree = await queue.get()
+                try:
+                    await self._challenge_tree(tree)
+                except Exception as e:
+                    bt.logging.error(f"Error challenging tree {tree.task_id}: {e}")
+        except KeyboardInterrupt:
+            bt.logging.info("Challenger shutting down...")
+        finally:
+            fetcher.cancel()
+    
+    async def _fetch_loop(self, queue: asyncio.Queue):
+        """Fetch challengeable trees each sweep and queue them for analysis."""
         while True:
             try:
-                # Sync metagraph
-                self.metagraph.sync()
-                
-                # Query for available trees to challenge
-                trees = await self.fetch_challengeable_trees()
+                # Sync metagraph; sweeps are already a minute apart
+                self._sync_metagraph()
                 
-                for tree in trees:
-                    # Analyze for weaknesses
-                    candidates = await self.analyze_tree(tree)
-                    
-                    # Submit challenges for profitable candidates
-                    for candidate in candidates:
-                        if candidate.ev >= self.min_ev and candidate.confidence >= self.min_confidence:
-                            success, result = await self.submit_challenge(candidate)
-                            if success:
-                                bt.logging.info(f"Submitted challenge: {result}")
-                            else:
-                                bt.logging.debug(f"Skipped challenge: {result}")
-                            
-                            # Rate limit
-                            await asyncio.sleep(1)
+                # Query for available trees to challenge; blocks while the
+                # analysis side is TREE_QUEUE_SIZE trees behind
+                for tree in await self.fetch_challengeable_trees():
+                    await queue.put(tree)
                 
                 # Sleep between sweeps
                 await asyncio.sleep(60)
                 
-            except KeyboardInterrupt:
-                bt.logging.info("Challenger shutting down...")
-                break
             except Exception as e:
-                bt.logging.error(f"Error in main loop: {e}")
+                bt.logging.error(f"Error fetching trees: {e}")
                 await asyncio.sleep(30)
     
+    async def _challenge_tree(self, tree: ReasoningTree):
+        """Analyze one tree and submit its challenges."""
+        # Submit each candidate as soon as its node is analyzed,
+        # overlapping up to the in-flight cap and submission rate
+        submissions = []
+        async for candidate in self.analyze_tree_stream(tree):
+            submissions.append(asyncio.ensure_future(self._submit_limited(candidate)))
+        await asyncio.gather(*submissions)
+    
     async def fetch_challengeable_trees(self) -> List[ReasoningTree]:
         """
         Fetch trees that are within the challenge window.
@@ -365,6 +720,11 @@ def get_config():
     parser.add_argument("--max_stake", type=float, default=50.0, help="Maximum stake per challenge")
     parser.add_argument("--min_confidence", type=float, default=0.6, help="Minimum confidence to challenge")
     parser.add_argument("--domains", type=str, help="Comma-separated domain specializations")
+    parser.add_argument("--max_concurrency", type=int, default=8, help="Maximum concurrent verification calls")
+    parser.add_argument("--max_challenges_per_tree", type=int, default=5, help="Maximum challenges submitted per tree")
+    parser.add_argument("--fallacy_prefilter", action="store_true", help="Skip fallacy checks on claims without fallacy marker words")
+    parser.add_argument("--max_inflight", type=int, default=4, help="Maximum concurrent challenge submissions")
+    parser.add_argument("--max_per_sec", type=float, default=1.0, help="Maximum challenge submissions started per second")
     
     # Add bittensor args
     bt.wallet.add_args(parser)
@@ -10,7 +10,7 @@ Defends against challenges when they arise.
 import argparse
 import asyncio
 import time
-from datetime import datetime
+from collections import OrderedDict
 from typing import Optional, Dict, List
 
 import bittensor as bt
@@ -30,8 +30,14 @@ from dialectic.protocol import (
     Evidence,
     NodeType,
     DefenseType,
+    format_timestamp,
 )
-from dialectic.merkle import create_merkle_commitment
+from dialectic.merkle import create_merkle_commitment, NODE_DUMP_INCLUDE
+from dialectic.challenge import CHALLENGE_WINDOW_SECONDS, DEFENSE_WINDOW_SECONDS
+
+
+# Submitted trees are kept until a challenge can no longer arrive and be defended
+PENDING_TREE_TTL_SECONDS = CHALLENGE_WINDOW_SECONDS + DEFENSE_WINDOW_SECONDS
 
 
 class Proposer:
@@ -53,10 +59,14 @@ class Proposer:
         self.subtensor = bt.subtensor(config=config)
         self.metagraph = self.subtensor.metagraph(netuid=config.netuid)
         self.dendrite = bt.dendrite(wallet=self.wallet)
+        self._hotkey = self.wallet.hotkey.ss58_address
         
         # Proposer state
         self.stake = config.stake if hasattr(config, 'stake') else 50.0
-        self.pending_trees: Dict[str, ReasoningTree] = {}
+        self.sync_every_n_blocks = config.sync_every_n_blocks if hasattr(config, 'sync_every_n_blocks') else 5
+        self._last_synced_block: Optional[int] = None
+        self.pending_trees: OrderedDict[str, ReasoningTree] = OrderedDict()
+        self._pending_tree_expiry: Dict[str, float] = {}  # task_id -> time the tree can be dropped
         self.active_defenses: Dict[str, Dict] = {}
         
         # LLM for reasoning generation (placeholder - implement with your preferred API)
@@ -82,7 +92,7 @@ class Proposer:
             tree.merkle_root = merkle_root
             
             # Store for potential defense
-            self.pending_trees[synapse.task_id] = tree
+            self._store_pending_tree(synapse.task_id, tree)
             
             return TreeSubmission(
                 task_id=synapse.task_id,
@@ -143,12 +153,29 @@ class Proposer:
             nodes=[premise1, premise2],
             merkle_root="",  # Will be filled after generation
             stake=self.stake,
-            proposer_hotkey=self.wallet.hotkey.ss58_address,
-            submitted_at=datetime.utcnow().isoformat()
+            proposer_hotkey=self._hotkey,
+            submitted_at=format_timestamp(int(time.time()))
         )
         
         return tree
     
+    def _store_pending_tree(self, task_id: str, tree: ReasoningTree):
+        """Keep a submitted tree for defense and drop trees whose windows have passed."""
+        now = time.time()
+        trees = self.pending_trees
+        expiry = self._pending_tree_expiry
+        trees[task_id] = tree
+        trees.move_to_end(task_id)
+        expiry[task_id] = now + PENDING_TREE_TTL_SECONDS
+        
+        # Oldest first, so stop at the first tree still in its window
+        while trees:
+            oldest = next(iter(trees))
+            if expiry[oldest] > now:
+                break
+            del trees[oldest]
+            del expiry[oldest]
+    
     async def handle_challenge(self, challenge: ChallengeSubmission) -> DefenseSubmission:
         """
         Handle an incoming challenge to our reasoning.
@@ -222,28 +249,33 @@ class Proposer:
     
     def _find_node(self, tree: ReasoningTree, node_id: str) -> Optional[ReasoningNode]:
         """Find a node in the tree by ID."""
-        if tree.root.id == node_id:
-            return tree.root
-        for node in tree.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return tree.node_index.get(node_id)
     
     def _tree_to_dict(self, tree: ReasoningTree) -> Dict:
         """Convert tree to dict for Merkle commitment."""
         return {
-            "root": tree.root.dict() if hasattr(tree.root, 'dict') else tree.root.__dict__,
-            "nodes": [n.dict() if hasattr(n, 'dict') else n.__dict__ for n in tree.nodes]
+            "root": tree.root.model_dump(include=NODE_DUMP_INCLUDE),
+            "nodes": [n.model_dump(include=NODE_DUMP_INCLUDE) for n in tree.nodes]
         }
     
+    def _sync_metagraph(self) -> bool:
+        """Sync the metagraph if sync_every_n_blocks have passed since the last sync."""
+        block = self.subtensor.get_current_block()
+        if self._last_synced_block is not None and block - self._last_synced_block < self.sync_every_n_blocks:
+            return False
+        
+        self.metagraph.sync()
+        self._last_synced_block = block
+        return True
+    
     async def run(self):
         """Main loop for the proposer."""
         bt.logging.info("Starting proposer main loop...")
         
         while True:
             try:
-                # Sync metagraph
-                self.metagraph.sync()
+                # Sync metagraph once enough blocks have passed
+                self._sync_metagraph()
                 
                 # Check for pending challenges that need defense
                 await self.check_pending_defenses()
@@ -271,6 +303,7 @@ def get_config():
     parser.add_argument("--netuid", type=int, required=True, help="Subnet UID")
     parser.add_argument("--stake", type=float, default=50.0, help="TAO to stake per tree")
     parser.add_argument("--llm_endpoint", type=str, help="LLM API endpoint for reasoning generation")
+    parser.add_argument("--sync_every_n_blocks", type=int, default=5, help="Blocks between metagraph syncs")
     
     # Add bittensor args
     bt.wallet.add_args(parser)
@@ -9,7 +9,12 @@ Implements the weighted consensus mechanism.
 
 import argparse
 import asyncio
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain, count
 from typing import Optional, Dict, List
 
 import bittensor as bt
@@ -29,17 +34,67 @@ from dialectic.protocol import (
     ReasoningTree,
     ReasoningNode,
     Verdict,
+    format_timestamp,
 )
 from dialectic.challenge import (
     ChallengeManager,
     DisputeStatus,
+    CHALLENGE_WINDOW_SECONDS,
+    DEFENSE_WINDOW_SECONDS,
 )
 from dialectic.consensus import (
     ValidatorConsensus,
     ValidatorTier,
     ConsensusResult,
 )
-from dialectic.merkle import ReasoningMerkleTree
+from dialectic.merkle import ReasoningMerkleTree, digest_nodes, encode_node, NODE_DUMP_INCLUDE
+
+
+# Computed Merkle roots kept by content digest before LRU eviction
+MERKLE_CACHE_SIZE = 4096
+# How long proposers have to answer a task
+TASK_DEADLINE_SECONDS = 6 * 3600
+# How long an accepted tree is kept: its challenge window plus the defense window
+TRACKED_TREE_TTL_SECONDS = CHALLENGE_WINDOW_SECONDS + DEFENSE_WINDOW_SECONDS
+
+
+@lru_cache(maxsize=1)
+def _task_id_prefix(minute: int) -> str:
+    """Task ID prefix (dt_YYYYMMDD_HHMM, UTC) for an epoch minute."""
+    return datetime.fromtimestamp(minute * 60, tz=timezone.utc).strftime('dt_%Y%m%d_%H%M')
+
+
+def _score_dispute(dispute: DisputeForAdjudication) -> Dict:
+    """
+    Default verdict scoring for a dispute.
+    
+    Module-level so Validator.generate_verdict can run it in a worker process.
+    """
+    # Placeholder - in practice would:
+    # 1. Verify the challenger's evidence
+    # 2. Evaluate the proposer's defense
+    # 3. Check logical validity
+    # 4. Determine verdict with confidence
+    
+    # Simple heuristic: if defense exists and has evidence, lean toward rejection
+    if dispute.defense and dispute.defense.evidence:
+        return {
+            "verdict": Verdict.CHALLENGE_REJECTED,
+            "confidence": 0.6,
+            "reasoning": "Defense provided counter-evidence"
+        }
+    elif dispute.defense and dispute.defense.defense_type.value == "concede":
+        return {
+            "verdict": Verdict.CHALLENGE_UPHELD,
+            "confidence": 0.9,
+            "reasoning": "Proposer conceded the challenge"
+        }
+    else:
+        return {
+            "verdict": Verdict.PARTIAL,
+            "confidence": 0.5,
+            "reasoning": "Insufficient information for clear verdict"
+        }
 
 
 class Validator:
@@ -61,21 +116,39 @@ class Validator:
         self.subtensor = bt.subtensor(config=config)
         self.metagraph = self.subtensor.metagraph(netuid=config.netuid)
         self.axon = bt.axon(wallet=self.wallet, config=config)
+        self._hotkey = self.wallet.hotkey.ss58_address
         
         # Validator components
         self.challenge_manager = ChallengeManager()
         self.consensus = ValidatorConsensus()
         
         # State
-        self.submitted_trees: Dict[str, ReasoningTree] = {}
-        self.task_counter = 0
+        # Accepted trees in submission order, kept until they can no longer
+        # be challenged and defended
+        self.submitted_trees: OrderedDict[str, ReasoningTree] = OrderedDict()
+        self._tree_expiry: Dict[str, float] = {}  # task_id -> time the tree can be dropped
+        # Content digest -> computed Merkle root (LRU), so resubmitted trees
+        # skip the full rebuild
+        self._merkle_cache: OrderedDict[bytes, str] = OrderedDict()
+        self._task_counter = count(1)
         self.stake = config.stake if hasattr(config, 'stake') else 100.0
         self.tier = ValidatorTier(config.tier) if hasattr(config, 'tier') else ValidatorTier.SCOUT
         self.auto_verdict = config.auto_verdict if hasattr(config, 'auto_verdict') else False
         
+        # Worker processes for verdict scoring; 0 scores on the event loop
+        self.verdict_workers = config.verdict_workers if hasattr(config, 'verdict_workers') else 0
+        self._verdict_pool = ProcessPoolExecutor(max_workers=self.verdict_workers) if self.verdict_workers > 0 else None
+        
+        # Set when a dispute's panel has fully voted, waking the main loop.
+        # Votes can arrive from axon handlers on another thread or loop, so
+        # the event is only ever set through the run loop (see run()).
+        self._disputes_ready = asyncio.Event()
+        self._run_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.consensus.on_ready = self._signal_dispute_ready
+        
         # Register self with consensus system
         self.consensus.register_validator(
-            hotkey=self.wallet.hotkey.ss58_address,
+            hotkey=self._hotkey,
             stake=self.stake,
             tier=self.tier
         )
@@ -89,23 +162,32 @@ class Validator:
         """Set up axon with request handlers."""
         self.axon.attach(
             forward_fn=self.handle_tree_submission,
-            blacklist_fn=self.blacklist_tree_submission,
+            blacklist_fn=self._blacklist_hook(self.blacklist_tree_submission),
         ).attach(
             forward_fn=self.handle_challenge,
-            blacklist_fn=self.blacklist_challenge,
+            blacklist_fn=self._blacklist_hook(self.blacklist_challenge),
         ).attach(
             forward_fn=self.handle_defense,
-            blacklist_fn=self.blacklist_defense,
+            blacklist_fn=self._blacklist_hook(self.blacklist_defense),
         )
     
+    def _blacklist_hook(self, fn):
+        """
+        fn if a subclass overrides it, else None.
+        
+        The base blacklist checks allow everything, so leaving them off lets
+        the axon skip a call per request until a real policy is added.
+        """
+        name = fn.__name__
+        return fn if getattr(type(self), name) is not getattr(Validator, name) else None
+    
     # ========================================================================
     # Task Assignment
     # ========================================================================
     
     async def assign_task(self, domain: str, prompt: str) -> TaskAssignment:
         """Create and broadcast a new task assignment."""
-        self.task_counter += 1
-        task_id = f"dt_{datetime.utcnow().strftime('%Y%m%d_%H%M')}_{self.task_counter}"
+        task_id = f"{_task_id_prefix(int(time.time()) // 60)}_{next(self._task_counter)}"
         
         task = TaskAssignment(
             task_id=task_id,
@@ -116,7 +198,7 @@ class Validator:
                 "min_nodes": 4,
                 "evidence_required": True
             },
-            deadline=(datetime.utcnow() + timedelta(hours=6)).isoformat(),
+            deadline=format_timestamp(int(time.time()) + TASK_DEADLINE_SECONDS),
             base_reward=0.5
         )
         
@@ -146,8 +228,13 @@ class Validator:
                 return synapse
             
             # Store the tree
-            synapse.tree.submitted_at = datetime.utcnow().isoformat()
-            self.submitted_trees[synapse.task_id] = synapse.tree
+            now = time.time()
+            synapse.tree.submitted_at = format_timestamp(int(now))
+            trees = self.submitted_trees
+            trees[synapse.task_id] = synapse.tree
+            trees.move_to_end(synapse.task_id)
+            self._tree_expiry[synapse.task_id] = now + TRACKED_TREE_TTL_SECONDS
+            self._prune_tracked_trees(now)
             
             synapse.accepted = True
             bt.logging.info(f"Tree accepted for task {synapse.task_id}")
@@ -159,6 +246,26 @@ class Validator:
         
         return synapse
     
+    def _prune_tracked_trees(self, now: float):
+        """
+        Drop tracked trees whose challenge and defense windows have passed.
+        
+        Trees are kept in submission order, so the scan stops at the first
+        tree still in its window. Expired trees with an open dispute stay
+        until it resolves, so adjudication can still find them.
+        """
+        active = self.challenge_manager.active_disputes_by_task
+        expiry = self._tree_expiry
+        expired = []
+        for task_id in self.submitted_trees:
+            if expiry[task_id] > now:
+                break
+            if not active.get(task_id):
+                expired.append(task_id)
+        for task_id in expired:
+            del self.submitted_trees[task_id]
+            del expiry[task_id]
+    
     def _validate_tree(self, tree: ReasoningTree) -> tuple[bool, Optional[str]]:
         """Validate a reasoning tree structure."""
         if not tree.root:
@@ -170,13 +277,12 @@ class Validator:
         if tree.stake < 10:  # Minimum stake
             return False, f"Stake {tree.stake} below minimum 10 TAO"
         
-        # Check node structure
-        node_ids = {tree.root.id}
-        for node in tree.nodes:
-            node_ids.add(node.id)
+        # Check node structure against the tree's ID index, which is cached
+        # on the tree and reused when challenges against it are validated
+        node_ids = tree.node_index
         
         # Verify all child references are valid
-        for node in [tree.root] + tree.nodes:
+        for node in chain((tree.root,), tree.nodes):
             for child_id in node.children:
                 if child_id not in node_ids:
                     return False, f"Invalid child reference: {child_id}"
@@ -185,12 +291,23 @@ class Validator:
     
     def _verify_merkle(self, tree: ReasoningTree) -> bool:
         """Verify the Merkle commitment of a tree."""
-        merkle_tree = ReasoningMerkleTree()
-        
-        all_nodes = [tree.root.dict() if hasattr(tree.root, 'dict') else tree.root.__dict__]
-        all_nodes.extend([n.dict() if hasattr(n, 'dict') else n.__dict__ for n in tree.nodes])
-        
-        computed_root = merkle_tree.build_from_reasoning_tree(all_nodes)
+        # Dump only the committed fields, and encode each node once for both
+        # the cache key and (on a miss) the leaf hashes
+        all_nodes = [n.model_dump(include=NODE_DUMP_INCLUDE) for n in chain((tree.root,), tree.nodes)]
+        encoded = [encode_node(node) for node in all_nodes]
+        
+        # The key covers the full node content, not just the claimed root,
+        # so a replay with altered nodes can't reuse an earlier result
+        key = digest_nodes(encoded)
+        cache = self._merkle_cache
+        computed_root = cache.get(key)
+        if computed_root is None:
+            computed_root = ReasoningMerkleTree().build_from_reasoning_tree(all_nodes, encoded)
+            cache[key] = computed_root
+            if len(cache) > MERKLE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
         
         return computed_root == tree.merkle_root
     
@@ -299,14 +416,7 @@ class Validator:
             return
         
         # Find the contested node
-        contested_node = None
-        if tree.root.id == dispute.target_node_id:
-            contested_node = tree.root
-        else:
-            for node in tree.nodes:
-                if node.id == dispute.target_node_id:
-                    contested_node = node
-                    break
+        contested_node = tree.node_index.get(dispute.target_node_id)
         
         if not contested_node:
             bt.logging.error(f"Contested node {dispute.target_node_id} not found")
@@ -344,7 +454,7 @@ class Validator:
             verdict = await self.generate_verdict(adjudication)
             self.consensus.submit_vote(
                 dispute_id=dispute_id,
-                validator_hotkey=self.wallet.hotkey.ss58_address,
+                validator_hotkey=self._hotkey,
                 verdict=verdict["verdict"],
                 confidence=verdict["confidence"],
                 reasoning=verdict["reasoning"]
@@ -354,33 +464,14 @@ class Validator:
         """
         Generate a verdict for a dispute.
         
-        Override for sophisticated adjudication logic.
+        Override for sophisticated adjudication logic. With verdict_workers
+        set, the default scoring runs in a process pool so it never blocks
+        the axon handlers sharing this event loop.
         """
-        # Placeholder - in practice would:
-        # 1. Verify the challenger's evidence
-        # 2. Evaluate the proposer's defense
-        # 3. Check logical validity
-        # 4. Determine verdict with confidence
-        
-        # Simple heuristic: if defense exists and has evidence, lean toward rejection
-        if dispute.defense and dispute.defense.evidence:
-            return {
-                "verdict": Verdict.CHALLENGE_REJECTED,
-                "confidence": 0.6,
-                "reasoning": "Defense provided counter-evidence"
-            }
-        elif dispute.defense and dispute.defense.defense_type.value == "concede":
-            return {
-                "verdict": Verdict.CHALLENGE_UPHELD,
-                "confidence": 0.9,
-                "reasoning": "Proposer conceded the challenge"
-            }
-        else:
-            return {
-                "verdict": Verdict.PARTIAL,
-                "confidence": 0.5,
-                "reasoning": "Insufficient information for clear verdict"
-            }
+        if self._verdict_pool is None:
+            return _score_dispute(dispute)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._verdict_pool, _score_dispute, dispute)
     
     async def finalize_disputes(self):
         """Check and finalize any disputes ready for resolution."""
@@ -389,20 +480,25 @@ class Validator:
         for dispute_id in expired:
             bt.logging.info(f"Defense window expired for {dispute_id}")
         
-        # Check for disputes ready for consensus
-        pending = self.challenge_manager.get_pending_adjudication()
-        for dispute in pending:
-            result = self.consensus.finalize_dispute(dispute.dispute_id)
-            if result and result.consensus_reached:
-                # Apply resolution
-                resolution = self.challenge_manager.resolve_dispute(
-                    dispute.dispute_id,
-                    result.final_verdict,
-                    result.weighted_score
-                )
-                
-                # Announce verdict
-                await self.announce_verdict(dispute.dispute_id, result, resolution)
+        # Finalize disputes whose panel has fully voted, plus any whose
+        # adjudication window has closed
+        results = [self.consensus.finalize_dispute(dispute_id) for dispute_id in self.consensus.pop_ready_disputes()]
+        results.extend(self.consensus.finalize_expired_disputes())
+        ready = [(result.dispute_id, result) for result in results if result and result.consensus_reached]
+        if not ready:
+            return
+        
+        # Apply this block's resolutions as one batch
+        resolutions = self.challenge_manager.resolve_disputes([
+            (dispute_id, result.final_verdict, result.weighted_score)
+            for dispute_id, result in ready
+        ])
+        
+        # Announce verdicts concurrently
+        await asyncio.gather(*[
+            self.announce_verdict(dispute_id, result, resolution)
+            for (dispute_id, result), resolution in zip(ready, resolutions)
+        ])
     
     async def announce_verdict(
         self, 
@@ -434,9 +530,16 @@ class Validator:
     # Main Loop
     # ========================================================================
     
+    def _signal_dispute_ready(self, dispute_id: str):
+        """Wake the main loop from whichever thread submitted the vote."""
+        loop = self._run_loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._disputes_ready.set)
+    
     async def run(self):
         """Main loop for the validator."""
         bt.logging.info("Starting validator main loop...")
+        self._run_loop = asyncio.get_running_loop()
         
         # Start axon
         self.axon.serve(netuid=self.config.netuid, subtensor=self.subtensor)
@@ -444,16 +547,26 @@ class Validator:
         
         bt.logging.info(f"Axon serving on port {self.config.axon.port}")
         
+        last_sync = None
         while True:
             try:
-                # Sync metagraph
-                self.metagraph.sync()
+                # Sync metagraph once per block; early wake-ups for ready
+                # disputes don't resync
+                now = time.monotonic()
+                if last_sync is None or now - last_sync >= 12:
+                    self.metagraph.sync()
+                    last_sync = now
                 
-                # Finalize any ready disputes
+                # Finalize any ready disputes; votes completing a panel from
+                # here on wake the loop early instead of waiting out the block
+                self._disputes_ready.clear()
                 await self.finalize_disputes()
                 
-                # Sleep between iterations
-                await asyncio.sleep(12)  # One block
+                # Sleep between iterations, unless a dispute becomes ready
+                try:
+                    await asyncio.wait_for(self._disputes_ready.wait(), timeout=12)  # One block
+                except asyncio.TimeoutError:
+                    pass
                 
             except KeyboardInterrupt:
                 bt.logging.info("Validator shutting down...")
@@ -463,6 +576,8 @@ class Validator:
                 await asyncio.sleep(12)
         
         self.axon.stop()
+        if self._verdict_pool is not None:
+            self._verdict_pool.shutdown()
 
 
 def get_config():
@@ -473,6 +588,7 @@ def get_config():
     parser.add_argument("--stake", type=float, default=100.0, help="Validator stake")
     parser.add_argument("--tier", type=str, default="scout", choices=["scout", "auditor", "arbiter"])
     parser.add_argument("--auto_verdict", action="store_true", help="Automatically generate verdicts")
+    parser.add_argument("--verdict_workers", type=int, default=0, help="Worker processes for verdict scoring (0 = inline)")
     parser.add_argument("--domains", type=str, help="Comma-separated domain specializations")
     
     # Add bittensor args
@@ -510,11 +626,15 @@ bittensor>=7.0.0
 # Data validation
 pydantic>=2.0.0
 
+# Numerics
+numpy>=1.24.0
+
 # Async support
 aiohttp>=3.9.0
 
 # Utilities
 python-dateutil>=2.8.0
+orjson>=3.9.0
 ```
 
 ---
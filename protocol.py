@@ -7,8 +7,11 @@ Defines the synapse types for communication between proposers, challengers, and
 """
 
 import bittensor as bt
-from typing import Optional, List, Dict, Any
-from pydantic import Field
+import numpy as np
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 from enum import Enum
 
 
@@ -48,16 +51,29 @@ class Verdict(str, Enum):
 # ============================================================================
 # Data Models
 # ============================================================================
+#
+# These are only ever carried inside synapses, never sent on their own, so
+# they are plain pydantic models rather than bt.Synapse subclasses and don't
+# each carry a set of request headers and terminal info.
 
-class Evidence(bt.Synapse):
+class Evidence(BaseModel):
     """Evidence supporting a reasoning node."""
     source: str = Field(description="Source of the evidence")
     data: str = Field(description="The evidence data/content")
     url: Optional[str] = Field(default=None, description="URL reference if applicable")
     timestamp: Optional[str] = Field(default=None, description="When evidence was gathered")
+    
+    _as_dict: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    @property
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialized form of this evidence, computed once on first access."""
+        if self._as_dict is None:
+            self._as_dict = self.dict()
+        return self._as_dict
 
 
-class ReasoningNode(bt.Synapse):
+class ReasoningNode(BaseModel):
     """A single node in the reasoning tree."""
     id: str = Field(description="Unique node identifier")
     claim: str = Field(description="The claim being made")
@@ -67,7 +83,36 @@ class ReasoningNode(bt.Synapse):
     merkle_hash: Optional[str] = Field(default=None, description="Merkle hash of this node")
 
 
-class ReasoningTree(bt.Synapse):
+# Small integer code per node type, for TreeView.types
+NODE_TYPE_CODES: Dict[NodeType, int] = {t: i for i, t in enumerate(NodeType)}
+
+
+class TreeView:
+    """
+    Column view of a reasoning tree's nodes, root first.
+    
+    Keeps node IDs, type codes and evidence flags in parallel arrays so
+    scans that only need that metadata can filter with NumPy masks
+    instead of walking the node objects.
+    """
+    
+    def __init__(self, nodes: List["ReasoningNode"]):
+        self.nodes = nodes
+        self.ids: List[str] = [n.id for n in nodes]
+        self.types = np.fromiter(
+            (NODE_TYPE_CODES[n.node_type] for n in nodes), dtype=np.int8, count=len(nodes)
+        )
+        self.has_evidence = np.fromiter(
+            (n.evidence is not None for n in nodes), dtype=bool, count=len(nodes)
+        )
+    
+    def select(self, mask: np.ndarray) -> List["ReasoningNode"]:
+        """Nodes where mask is set, in view order."""
+        nodes = self.nodes
+        return [nodes[i] for i in np.flatnonzero(mask)]
+
+
+class ReasoningTree(BaseModel):
     """Complete reasoning tree submitted by a proposer."""
     task_id: str = Field(description="Task identifier")
     root: ReasoningNode = Field(description="Root node of the tree")
@@ -76,6 +121,27 @@ class ReasoningTree(bt.Synapse):
     stake: float = Field(description="TAO staked on this tree")
     proposer_hotkey: str = Field(description="Proposer's hotkey")
     submitted_at: Optional[str] = Field(default=None)
+    
+    _node_index: Optional[Dict[str, ReasoningNode]] = PrivateAttr(default=None)
+    _view: Optional[TreeView] = PrivateAttr(default=None)
+    # (submitted_at string it was derived from, challenge window end timestamp)
+    _challenge_window: Optional[Tuple[str, float]] = PrivateAttr(default=None)
+    
+    @property
+    def node_index(self) -> Dict[str, ReasoningNode]:
+        """Node ID -> node lookup, built once on first access."""
+        if self._node_index is None:
+            index = {n.id: n for n in self.nodes}
+            index[self.root.id] = self.root
+            self._node_index = index
+        return self._node_index
+    
+    @property
+    def view(self) -> TreeView:
+        """Column view of [root] + nodes, built once on first access."""
+        if self._view is None:
+            self._view = TreeView([self.root] + self.nodes)
+        return self._view
 
 
 # ============================================================================
@@ -180,6 +246,28 @@ ATTACK_MULTIPLIERS = {
     AttackType.CONTRADICTION: 3.0,
     AttackType.OUTDATED: 1.5,
 }
+
+# Dense code per attack type (declaration order) and the multipliers laid out
+# in the same order, so batches of challenges can look up multipliers as
+# ATTACK_MULTIPLIER_ARRAY[codes]
+ATTACK_TYPE_CODES: Dict[AttackType, int] = {at: i for i, at in enumerate(AttackType)}
+ATTACK_MULTIPLIER_ARRAY = np.array([ATTACK_MULTIPLIERS[at] for at in AttackType], dtype=np.float64)
+
+
+# ============================================================================
+# Timestamps
+# ============================================================================
+
+@lru_cache(maxsize=2)
+def format_timestamp(seconds: int) -> str:
+    """
+    Naive-UTC ISO-8601 string for an epoch second, as used by submitted_at
+    and deadline.
+    
+    Two entries cover a submission time and a deadline formatted in the
+    same second, so bursts format each only once.
+    """
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None).isoformat()
 ```
 
 ---